@@ -10,6 +10,7 @@ from resources.buttons import Buttons
 from state.app_state import AppState
 from events.event_handler import EventHandler
 from services.excel_processor import ExcelProcessor
+from services.status_server import start_status_server
 from resources.file_types import FileTypes
 
 class ExcelProcessorApp:
@@ -50,6 +51,9 @@ class ExcelProcessorApp:
             self.progress_frame.update_progress
         )
         
+        # 실행 상태 엔드포인트 (ABR_STATUS_PORT 가 설정된 경우에만)
+        self.status_server = start_status_server(self.excel_processor.status)
+        
         # UI 구성
         self.create_widgets()
         
@@ -59,6 +63,9 @@ class ExcelProcessorApp:
         # 이벤트 핸들러에 엑셀 프로세서 참조 전달
         self.event_handler.set_excel_processor(self.excel_processor)
         
+        # 이벤트 핸들러에 미리 읽기 요약 표시 프레임 전달
+        self.event_handler.set_preview_frame(self.monthly_frame)
+        
         # 입력 변경 감지 설정
         self.setup_input_traces()
         
@@ -170,7 +177,7 @@ class ExcelProcessorApp:
             else:
                 self.root.after(0, self.event_handler.on_processing_error)
         except Exception as e:
-            print(f"작업 처리 중 오류 발생: {e}")
+            self.excel_processor.report_error(f"작업 처리 중 오류 발생: {e}")
             self.root.after(0, self.event_handler.on_processing_error)
         
     def select_file(self, string_var):
@@ -14,6 +14,7 @@ class EventHandler:
         self.process_button = None  # 시작 버튼 참조를 저장할 변수
         self.excel_processor = None  # 엑셀 프로세서 참조를 저장할 변수
         self.cancel_thread = None    # 취소 처리를 위한 스레드
+        self.preview_frame = None    # 미리 읽기 요약을 표시할 프레임
         
     def set_process_button(self, button):
         """시작 버튼 참조를 설정합니다."""
@@ -23,14 +24,46 @@ class EventHandler:
         """엑셀 프로세서 참조를 설정합니다."""
         self.excel_processor = processor
         
+    def set_preview_frame(self, frame):
+        """미리 읽기 요약을 표시할 프레임을 설정합니다."""
+        self.preview_frame = frame
+        
     def on_input_change(self, *args):
         """입력 필드가 변경되었을 때 호출되는 콜백 함수입니다."""
         if self.state.is_processing:
             return
             
         if self.state.has_paths_changed():
+            previous = self.state.last_paths
             self.state.update_last_paths()
             self.progress_callback(0, "")
+            self.prefetch_inputs(previous)
+            
+    def prefetch_inputs(self, previous):
+        """변경된 입력 파일을 백그라운드에서 미리 읽기 시작합니다."""
+        if not self.excel_processor:
+            return
+            
+        current = self.state.get_current_paths()
+        for key, attr in (('monthly', 'monthly_file'), ('vendor', 'vendor_file')):
+            path = getattr(current, attr)
+            if path == getattr(previous, attr):
+                continue
+            if os.path.isfile(path):
+                self.excel_processor.prefetch(key, path, self.on_prefetch_ready)
+            else:
+                self.excel_processor.prefetcher.cancel(key)
+        self.update_preview()
+        
+    def on_prefetch_ready(self, key):
+        """미리 읽기가 끝났을 때 작업 스레드에서 호출됩니다."""
+        if self.preview_frame:
+            self.preview_frame.after(0, self.update_preview)
+            
+    def update_preview(self):
+        """미리 읽은 데이터의 요약을 표시합니다."""
+        if self.preview_frame and self.excel_processor:
+            self.preview_frame.update_preview(self.excel_processor.preview())
             
     def on_start_processing(self):
         """작업 시작 이벤트를 처리합니다."""
@@ -0,0 +1,18 @@
+from resources.template_layout import TemplateLayout
+
+class MonthlySchema:
+    # 월별 거래명세서에서 실제로 사용하는 열
+    VENDOR_CODE = "거래처코드"
+    DATE_COLUMNS = ["년", "월", "일"]
+    COLUMNS = [VENDOR_CODE, *DATE_COLUMNS, *TemplateLayout.ITEM_COLUMNS]
+
+    # 누계 집계에 사용하는 열
+    YEAR = "년"
+    MONTH = "월"
+    WASTE_TYPE = "폐기물종류"
+    QUANTITY = "수량"
+    AMOUNT = "공급가액"
+
+class VendorSchema:
+    # 거래처별 템플릿 파일 열 (비어 있으면 기본 템플릿, 상대 경로는 기본 템플릿 폴더 기준)
+    TEMPLATE = "템플릿"
@@ -0,0 +1,12 @@
+import os
+
+class StatusServerConfig:
+    # 실행 상태 엔드포인트 (외부에서 접근할 수 없도록 localhost 에만 바인딩)
+    HOST = "127.0.0.1"
+
+    # 포트 환경 변수 (설정하지 않으면 상태 서버를 시작하지 않음)
+    PORT_ENV = "ABR_STATUS_PORT"
+    PORT = os.environ.get(PORT_ENV, "").strip()
+
+    # 진행이 멈춘 것으로 보는 시간 (초, /status 의 stalled 값에 사용)
+    STALL_SECONDS = 300
@@ -0,0 +1,9 @@
+import os
+
+class Storage:
+    # 거래처별 월 누계 저장소 (실행할 때마다 갱신)
+    DATA_DIR = os.path.join(os.path.expanduser("~"), ".abr_bill_auto")
+    AGGREGATE_DB = os.path.join(DATA_DIR, "aggregates.sqlite3")
+
+    # 요약 보고서 파일명
+    SUMMARY_FILENAME = "[요약]{year}년_{month:02d}월_거래처별_누계.xlsx"
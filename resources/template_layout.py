@@ -0,0 +1,64 @@
+class TemplateLayout:
+    # 거래명세표로 사용할 템플릿 시트 (0부터 시작)
+    SHEET_INDEX = 0
+
+    # 컴파일해 두는 템플릿 최대 개수 (거래처별 템플릿 사용 시)
+    CACHE_SIZE = 8
+
+    # 머리글 셀
+    VENDOR_NAME_CELL = "B4"
+    PERIOD_CELL = "B5"
+    PAGE_CELL = "H5"
+
+    # 전월/누계 금액 셀 (합계와 함께 마지막 페이지에만 기록, None 이면 기록하지 않음)
+    PRIOR_MONTH_AMOUNT_CELL = "G39"
+    YTD_AMOUNT_CELL = "G40"
+
+    # 거래 내역 영역
+    ITEM_START_ROW = 9
+    ITEMS_PER_PAGE = 25
+    ITEM_COLUMNS = {
+        "월": "A",
+        "일": "B",
+        "폐기물종류": "C",
+        "수량": "D",
+        "단위": "E",
+        "단가": "F",
+        "공급가액": "G",
+    }
+
+    # 템플릿마다 위치가 다르면 템플릿 워크북(또는 템플릿 시트)에 아래 이름을 정의해 기본값 대신 사용
+    # 셀 이름은 셀 하나, 거래 내역은 첫 행부터 페이지당 행 수만큼의 범위, 열 이름은 해당 열의 셀
+    CELL_NAMES = {
+        "vendor_name_cell": "ABR_VENDOR_NAME",
+        "period_cell": "ABR_PERIOD",
+        "page_cell": "ABR_PAGE",
+        "prior_month_amount_cell": "ABR_PRIOR_MONTH_AMOUNT",
+        "ytd_amount_cell": "ABR_YTD_AMOUNT",
+    }
+    ITEMS_NAME = "ABR_ITEMS"
+    ITEM_COLUMN_NAMES = {
+        "월": "ABR_MONTH",
+        "일": "ABR_DAY",
+        "폐기물종류": "ABR_WASTE_TYPE",
+        "수량": "ABR_QUANTITY",
+        "단위": "ABR_UNIT",
+        "단가": "ABR_UNIT_PRICE",
+        "공급가액": "ABR_AMOUNT",
+    }
+
+    # 여러 페이지일 때 이어지는 페이지 첫 행에 앞 페이지까지의 합계를 이월
+    # (거래 내역 영역 아래의 합계 영역은 마지막 페이지에만 남김)
+    CARRY_FORWARD_LABEL_COLUMN = "폐기물종류"
+    CARRY_FORWARD_LABEL = "전 페이지 이월"
+    CARRY_FORWARD_COLUMNS = ["공급가액"]
+
+    # 모든 수식을 계산해 캐시 값을 저장했을 때 기록하는 계산 엔진 버전 (Excel 2016 이후)
+    # 파일의 calcId 가 Excel 의 계산 엔진보다 낮으면 Excel 이 열 때 전체를 다시 계산함
+    CALC_ID = 191029
+
+    # 출력 형식
+    PERIOD_FORMAT = "{year}년 {month:02d}월"
+    PAGE_FORMAT = "{page}/{total}"
+    CONTINUATION_TITLE = "{title} ({page})"
+    FILENAME = "[폐기물]{year}년_{month:02d}월_{vendor_name}_거래명세표.xlsx"
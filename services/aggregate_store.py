@@ -0,0 +1,134 @@
+import os
+import sqlite3
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from resources.schema import MonthlySchema
+
+def prior_month(year: int, month: int) -> Tuple[int, int]:
+    """전월의 (년, 월)을 반환합니다."""
+    return (year - 1, 12) if month == 1 else (year, month - 1)
+
+class AggregateStore:
+    """거래처·년·월·폐기물종류별 수량과 금액을 로컬 SQLite 파일에 누적합니다.
+
+    같은 거래처의 같은 달을 다시 처리하면 기존 집계를 새 값으로 바꾸므로,
+    같은 월별 파일을 여러 번 실행해도 누계가 중복되지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS vendor_monthly (
+                vendor_code TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                month INTEGER NOT NULL,
+                waste_type TEXT NOT NULL,
+                quantity REAL NOT NULL,
+                amount REAL NOT NULL,
+                row_count INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (vendor_code, year, month, waste_type)
+            )
+        """)
+
+    def record(self, vendor_code: str, vendor_data: pd.DataFrame):
+        """거래처 한 곳의 거래 내역을 월·폐기물종류별로 집계해 저장합니다."""
+        frame = pd.DataFrame({
+            'year': vendor_data[MonthlySchema.YEAR].astype(int),
+            'month': vendor_data[MonthlySchema.MONTH].astype(int),
+            'waste_type': self._column(vendor_data, MonthlySchema.WASTE_TYPE, "")
+                .fillna("").astype(str),
+            'quantity': pd.to_numeric(
+                self._column(vendor_data, MonthlySchema.QUANTITY, 0), errors='coerce'
+            ).fillna(0),
+            'amount': pd.to_numeric(
+                self._column(vendor_data, MonthlySchema.AMOUNT, 0), errors='coerce'
+            ).fillna(0),
+        })
+        grouped = frame.groupby(['year', 'month', 'waste_type'], sort=False).agg(
+            quantity=('quantity', 'sum'),
+            amount=('amount', 'sum'),
+            row_count=('quantity', 'size'),
+        ).reset_index()
+
+        updated_at = datetime.now().isoformat(timespec='seconds')
+        months = grouped[['year', 'month']].drop_duplicates().itertuples(index=False)
+        self.connection.executemany(
+            "DELETE FROM vendor_monthly WHERE vendor_code = ? AND year = ? AND month = ?",
+            [(vendor_code, int(year), int(month)) for year, month in months]
+        )
+        self.connection.executemany(
+            "INSERT INTO vendor_monthly VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (vendor_code, int(row.year), int(row.month), row.waste_type,
+                 float(row.quantity), float(row.amount), int(row.row_count), updated_at)
+                for row in grouped.itertuples(index=False)
+            ]
+        )
+
+    @staticmethod
+    def _column(vendor_data: pd.DataFrame, column: str, default) -> pd.Series:
+        """열이 없으면 기본값으로 채운 Series 를 반환합니다."""
+        if column in vendor_data:
+            return vendor_data[column]
+        return pd.Series(default, index=vendor_data.index)
+
+    def month_amount(self, vendor_code: str, year: int, month: int) -> Optional[float]:
+        """해당 월의 금액 합계를 반환합니다. 기록된 적 없는 달이면 None 입니다."""
+        row = self.connection.execute(
+            "SELECT SUM(amount) FROM vendor_monthly "
+            "WHERE vendor_code = ? AND year = ? AND month = ?",
+            (vendor_code, year, month)
+        ).fetchone()
+        return row[0]
+
+    def ytd_amount(self, vendor_code: str, year: int, month: int) -> Optional[float]:
+        """해당 연도 1월부터 해당 월까지의 금액 누계를 반환합니다. 기록이 없으면 None 입니다."""
+        row = self.connection.execute(
+            "SELECT SUM(amount) FROM vendor_monthly "
+            "WHERE vendor_code = ? AND year = ? AND month <= ?",
+            (vendor_code, year, month)
+        ).fetchone()
+        return row[0]
+
+    def summary(self, year: int, month: int,
+                vendor_codes: Optional[List[str]] = None) -> pd.DataFrame:
+        """거래처·폐기물종류별 당월, 전월, 연간 누계 수량과 금액을 반환합니다."""
+        prior_year, prior = prior_month(year, month)
+        frame = pd.read_sql_query(
+            """
+            SELECT vendor_code AS 거래처코드,
+                   waste_type AS 폐기물종류,
+                   SUM(CASE WHEN year = :year AND month = :month THEN quantity ELSE 0 END) AS 당월수량,
+                   SUM(CASE WHEN year = :year AND month = :month THEN amount ELSE 0 END) AS 당월금액,
+                   SUM(CASE WHEN year = :prior_year AND month = :prior THEN amount ELSE 0 END) AS 전월금액,
+                   SUM(CASE WHEN year = :year AND month <= :month THEN quantity ELSE 0 END) AS 누계수량,
+                   SUM(CASE WHEN year = :year AND month <= :month THEN amount ELSE 0 END) AS 누계금액
+            FROM vendor_monthly
+            WHERE (year = :year AND month <= :month)
+               OR (year = :prior_year AND month = :prior)
+            GROUP BY vendor_code, waste_type
+            ORDER BY vendor_code, waste_type
+            """,
+            self.connection,
+            params={'year': year, 'month': month, 'prior_year': prior_year, 'prior': prior}
+        )
+        if vendor_codes is not None:
+            frame = frame[frame['거래처코드'].isin(vendor_codes)]
+        return frame.reset_index(drop=True)
+
+    def commit(self):
+        """변경 내용을 저장합니다."""
+        self.connection.commit()
+
+    def close(self):
+        """변경 내용을 저장하고 연결을 닫습니다."""
+        self.connection.commit()
+        self.connection.close()
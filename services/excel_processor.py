@@ -1,46 +1,140 @@
 import os
-import time
+import zipfile
 import pandas as pd
 from datetime import datetime
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from state.app_state import AppState
+from services.statement_template import CompiledTemplate
+from services.template_cache import TemplateCache
+from services.xlsx_reader import ReadCancelled, read_xlsx_columns
+from services.input_prefetcher import InputPrefetcher
+from services.vendor_stream import UnsortedExport, iter_vendor_groups, vendor_key
+from resources.template_layout import TemplateLayout
+from services.aggregate_store import AggregateStore, prior_month
+from services.status_server import RunStatus
+from resources.schema import MonthlySchema, VendorSchema
+from resources.storage import Storage
 
 class ExcelProcessor:
     def __init__(self, state: AppState, progress_callback: Callable[[int, str], None]):
         self.state = state
         self.progress_callback = progress_callback
+        self.status = RunStatus()    # 상태 서버에 제공하는 실행 상태
+        self.prefetcher = InputPrefetcher(on_error=self.report_error)
+        self.templates = TemplateCache()  # 실행 간에도 유지되는 컴파일된 템플릿
+        self.aggregates = None       # 거래처별 누계 저장소
+        self.recorded_vendors = set()
+        self.report_period = None
         self.reset_data()
         
+    def report_progress(self, value: float, message: str):
+        """진행 상태를 화면과 실행 상태에 함께 기록합니다."""
+        self.status.update_progress(value, message)
+        self.progress_callback(value, message)
+        
+    def report_error(self, message: str):
+        """오류를 콘솔에 출력하고 실행 상태에 마지막 오류로 기록합니다."""
+        print(message)
+        self.status.record_error(message)
+        
+    def is_cancelled(self) -> bool:
+        """작업이 취소되었는지 확인합니다."""
+        return not self.state.is_processing or self.state.was_cancelled
+        
     def reset_data(self):
         """데이터를 초기화합니다."""
         self.monthly_data = None
         self.vendor_mapping = None
-        self.template_data = None
+        self.template = None
+        self.vendor_templates = {}
+        self.target_names = {}  # 자동화 대상 거래처 키별 거래처명
         
-    def read_input_files(self) -> bool:
-        """입력 파일들을 읽어옵니다."""
+    def read_input_files(self, stream: bool = False) -> bool:
+        """입력 파일들을 읽어옵니다. stream 이면 월별 파일은 생성 단계에서 읽습니다."""
         try:
             # 데이터 초기화
             self.reset_data()
+            self.status.start_stage("read")
             
             # 1. 월별 RAW 파일 읽기
-            self.progress_callback(5, "월별 거래명세서 파일을 읽는 중...")
-            self.monthly_data = pd.read_excel(self.state.monthly_file.get(), engine='openpyxl')
+            if not stream:
+                self.report_progress(5, "월별 거래명세서 파일을 읽는 중...")
+                monthly_file = self.state.monthly_file.get()
+                self.monthly_data = self.prefetcher.get('monthly', monthly_file, self.is_cancelled)
+                if self.monthly_data is None:
+                    self.monthly_data = self.load_monthly_file(monthly_file)
 
             # 2. 거래처별 매핑 파일 읽기
-            self.progress_callback(7, "거래처별 매핑 파일을 읽는 중...")
-            self.vendor_mapping = pd.read_excel(self.state.vendor_file.get(), engine='openpyxl')
+            self.report_progress(7, "거래처별 매핑 파일을 읽는 중...")
+            vendor_file = self.state.vendor_file.get()
+            self.vendor_mapping = self.prefetcher.get('vendor', vendor_file, self.is_cancelled)
+            if self.vendor_mapping is None:
+                self.vendor_mapping = self.load_vendor_file(vendor_file)
             
             # 3. 템플릿 파일 읽기
-            self.progress_callback(10, "템플릿 파일을 읽는 중...")
-            self.template_data = pd.read_excel(self.state.template_file.get(), engine='openpyxl')
+            self.report_progress(10, "템플릿 파일을 읽는 중...")
+            self.template = self.templates.get(self.state.template_file.get())
+            self.vendor_templates = self.read_vendor_templates()
             return True
             
+        except ReadCancelled:
+            print("작업이 취소되었습니다.")
+            self.reset_data()
+            return False
+            
         except Exception as e:
-            print(f"파일 읽기 오류: {e}")
+            self.report_error(f"파일 읽기 오류: {e}")
             self.reset_data()  # 오류 발생 시 데이터 초기화
             return False
             
+    def load_monthly_file(self, path: str,
+                          cancelled: Optional[Callable[[], bool]] = None) -> pd.DataFrame:
+        """월별 거래명세서 파일을 읽습니다."""
+        if zipfile.is_zipfile(path):
+            return read_xlsx_columns(path, MonthlySchema.COLUMNS, cancelled)
+        return pd.read_excel(path, engine='openpyxl')
+        
+    def load_vendor_file(self, path: str,
+                         cancelled: Optional[Callable[[], bool]] = None) -> pd.DataFrame:
+        """거래처별 매핑 파일을 읽습니다."""
+        if zipfile.is_zipfile(path):
+            return read_xlsx_columns(path, cancelled=cancelled)
+        return pd.read_excel(path, engine='openpyxl')
+        
+    def prefetch(self, key: str, path: str, on_ready: Callable[[str], None]):
+        """입력 파일을 백그라운드에서 미리 읽기 시작합니다."""
+        loader = self.load_monthly_file if key == 'monthly' else self.load_vendor_file
+        self.prefetcher.start(key, path, loader, on_ready)
+        
+    def should_stream(self) -> bool:
+        """월별 파일을 미리 다 읽어 두지 않았으면 거래처 단위 스트리밍으로 처리합니다.
+
+        아직 읽는 중인 미리 읽기는 기다리지 않고 취소해, 첫 거래명세서가 바로 만들어지고
+        메모리 사용량이 가장 큰 거래처 크기에 맞춰지도록 합니다.
+        """
+        monthly_file = self.state.monthly_file.get()
+        if self.prefetcher.is_ready('monthly', monthly_file):
+            return False
+        if not zipfile.is_zipfile(monthly_file):
+            return False
+        self.prefetcher.cancel('monthly')
+        return True
+        
+    def preview(self) -> str:
+        """미리 읽은 데이터로 간단한 요약 문구를 만듭니다."""
+        monthly = self.prefetcher.peek('monthly')
+        if monthly is None or '거래처코드' not in monthly:
+            return ""
+            
+        vendor_keys = set(monthly['거래처코드'].map(vendor_key)) - {""}
+        parts = [f"{len(monthly):,}행", f"거래처 {len(vendor_keys):,}곳"]
+        
+        vendor_mapping = self.prefetcher.peek('vendor')
+        if vendor_mapping is not None and '자동화_대상' in vendor_mapping:
+            targets = vendor_mapping[vendor_mapping['자동화_대상'] == True]['거래처코드']
+            parts.append(f"자동화 대상 {len(vendor_keys & set(targets.map(vendor_key))):,}곳")
+        return " · ".join(parts)
+        
     def filter_automation_targets(self) -> bool:
         """자동화 대상 거래처만 필터링합니다."""
         try:
@@ -54,78 +148,278 @@ class ExcelProcessor:
             #     return True
                 
             # 1. 자동화 대상 거래처 필터링
-            self.progress_callback(15, "자동화 대상 거래처 필터링 중...")
-            if self.state.process_all_vendors.get():
-                automation_targets = self.vendor_mapping
-            else:
-                automation_targets = self.vendor_mapping[
-                    self.vendor_mapping['자동화_대상'] == True
-                ]
+            self.status.start_stage("filter")
+            self.report_progress(15, "자동화 대상 거래처 필터링 중...")
+            self.target_names = self.get_vendor_names(self.get_automation_targets())
             
-            # 2. 월별 데이터에서 자동화 대상만 필터링
-            self.progress_callback(20, "월별 데이터 필터링 중...")
+            # 2. 월별 데이터에서 자동화 대상만 필터링 (스트리밍과 같은 거래처코드 비교 규칙)
+            self.report_progress(20, "월별 데이터 필터링 중...")
             self.monthly_data = self.monthly_data[
-                self.monthly_data['거래처코드'].isin(automation_targets['거래처코드'])
+                self.monthly_data['거래처코드'].map(vendor_key).isin(self.target_names)
             ]
             
             # 총 거래처 수 표시
-            total_vendors = len(automation_targets)
-            if hasattr(self.progress_callback, '__self__'):
-                self.progress_callback.__self__.update_vendor_count(total_vendors)
+            self.update_vendor_count(len(self.target_names))
             return True
             
         except Exception as e:
-            print(f"데이터 필터링 오류: {e}")
+            self.report_error(f"데이터 필터링 오류: {e}")
             return False
             
-    def generate_statements(self) -> bool:
-        """거래명세서를 생성합니다."""
+    def get_automation_targets(self) -> pd.DataFrame:
+        """거래처 매핑에서 자동화 대상 거래처를 반환합니다."""
+        if self.state.process_all_vendors.get():
+            return self.vendor_mapping
+        return self.vendor_mapping[self.vendor_mapping['자동화_대상'] == True]
+        
+    @staticmethod
+    def get_vendor_names(vendors: pd.DataFrame) -> Dict[str, str]:
+        """거래처코드 키(vendor_key)별 거래처명을 반환합니다. 중복되면 처음 것을 사용합니다."""
+        vendor_names = {}
+        for code, name in zip(vendors['거래처코드'], vendors['거래처명']):
+            key = vendor_key(code)
+            if key:
+                vendor_names.setdefault(key, name)
+        return vendor_names
+        
+    def update_vendor_count(self, total_vendors: int):
+        """총 거래처 수를 표시합니다."""
+        self.status.set_vendor_total(total_vendors)
+        if hasattr(self.progress_callback, '__self__'):
+            self.progress_callback.__self__.update_vendor_count(total_vendors)
+            
+    def generate_statements(self, written: Optional[Dict[str, int]] = None) -> bool:
+        """거래명세서를 생성합니다. written 에 같은 행 수로 기록된 거래처는 건너뜁니다."""
         try:
             # 거래처별로 데이터 그룹화
-            grouped_data = self.monthly_data.groupby('거래처코드')
+            self.status.start_stage("generate")
+            grouped_data = self.monthly_data.groupby(self.monthly_data['거래처코드'].map(vendor_key))
             total_vendors = len(grouped_data)
             
             # 출력 디렉토리 가져오기
             output_dir = self.state.output_dir.get()
             
-            for idx, (vendor_code, vendor_data) in enumerate(grouped_data, 1):
+            for idx, (key, vendor_data) in enumerate(grouped_data, 1):
                 if not self.state.is_processing:
                     print("작업이 취소되었습니다.")
                     return False
                     
-                # 거래처명 가져오기
-                vendor_name = self.vendor_mapping[
-                    self.vendor_mapping['거래처코드'] == vendor_code
-                ]['거래처명'].iloc[0]
+                # 스트리밍 처리 중 이미 완성된 거래명세서는 건너뛰기
+                if written and written.get(key) == len(vendor_data):
+                    continue
+                    
+                vendor_name = self.target_names[key]
                 
                 # 진행률 계산 (20% ~ 90%)
                 progress = 20 + (idx / total_vendors * 70)
-                self.progress_callback(
+                self.report_progress(
                     progress,
                     f"거래명세서 생성 중... ({idx}/{total_vendors}) - {vendor_name}"
                 )
                 
-                # 날짜순 정렬
-                vendor_data = vendor_data.sort_values(['년', '월', '일'])
+                self.write_statement(key, vendor_name, vendor_data, output_dir)
+                
+            return True
+            
+        except Exception as e:
+            self.report_error(f"거래명세서 생성 오류: {e}")
+            return False
+            
+    def stream_statements(self) -> bool:
+        """정렬된 월별 거래명세서를 거래처 단위로 읽으면서 바로 거래명세서를 생성합니다."""
+        written: Dict[str, int] = {}
+        try:
+            self.status.start_stage("filter")
+            self.report_progress(15, "자동화 대상 거래처 확인 중...")
+            vendor_names = self.get_vendor_names(self.get_automation_targets())
+            targets = set(vendor_names)
+            total_vendors = len(targets)
+            self.update_vendor_count(total_vendors)
+            
+            # 출력 디렉토리 가져오기
+            output_dir = self.state.output_dir.get()
+            
+            # 스트리밍 처리는 읽기와 생성이 함께 진행되므로 생성 단계로 기록
+            self.status.start_stage("generate")
+            self.report_progress(20, "월별 거래명세서 파일을 읽는 중...")
+            groups = iter_vendor_groups(
+                self.state.monthly_file.get(),
+                targets,
+                cancelled=self.is_cancelled
+            )
+            for idx, (key, vendor_data) in enumerate(groups, 1):
+                if not self.state.is_processing:
+                    print("작업이 취소되었습니다.")
+                    return False
+                    
+                vendor_name = vendor_names[key]
                 
-                # TODO: 실제 엑셀 파일 생성 로직 구현
-                # 1. 템플릿 복사
-                # 2. 데이터 매핑
-                # 3. 파일 저장
-                # 파일명 형식: [폐기물]2024년_05월_거래처명_거래명세표.xlsx
-                # 저장 경로: output_dir/[폐기물]2024년_05월_거래처명_거래명세표.xlsx
+                # 진행률 계산 (20% ~ 90%)
+                progress = 20 + (min(idx, total_vendors) / total_vendors * 70)
+                self.report_progress(
+                    progress,
+                    f"거래명세서 생성 중... ({idx}/{total_vendors}) - {vendor_name}"
+                )
                 
-                # 임시로 처리 시간 시뮬레이션
-                time.sleep(2)
+                self.write_statement(key, vendor_name, vendor_data, output_dir)
+                written[key] = len(vendor_data)
                 
             return True
             
+        except ReadCancelled:
+            print("작업이 취소되었습니다.")
+            return False
+            
+        except UnsortedExport as e:
+            # 정렬되지 않은 파일은 전체를 읽어 기존 방식으로 처리
+            print(f"월별 거래명세서가 거래처코드 순이 아니므로 전체를 읽어 처리합니다: {e}")
+            return self.process_in_memory(written)
+            
+        except Exception as e:
+            self.report_error(f"거래명세서 생성 오류: {e}")
+            return False
+            
+    def process_in_memory(self, written: Dict[str, int]) -> bool:
+        """스트리밍 처리를 중단하고 월별 파일 전체를 읽어 나머지 거래명세서를 생성합니다."""
+        try:
+            self.status.start_stage("read")
+            self.report_progress(5, "월별 거래명세서 파일을 읽는 중...")
+            self.monthly_data = self.load_monthly_file(
+                self.state.monthly_file.get(), self.is_cancelled
+            )
+        except ReadCancelled:
+            print("작업이 취소되었습니다.")
+            return False
         except Exception as e:
-            print(f"거래명세서 생성 오류: {e}")
+            self.report_error(f"파일 읽기 오류: {e}")
+            return False
+            
+        if not self.filter_automation_targets():
             return False
+        return self.generate_statements(written)
+        
+    def write_statement(self, vendor_code, vendor_name: str, vendor_data: pd.DataFrame,
+                        output_dir: str):
+        """거래처 한 곳의 거래명세서를 템플릿에 기록해 저장합니다."""
+        # 날짜순 정렬
+        vendor_data = vendor_data.sort_values(['년', '월', '일'])
+        year = int(vendor_data['년'].iloc[0])
+        month = int(vendor_data['월'].iloc[0])
+        
+        # 누계 저장소 갱신 후 전월/누계 금액 조회
+        amounts = self.record_aggregates(vendor_key(vendor_code), vendor_data, year, month)
+        
+        # 템플릿에 거래 내역 기록 후 저장
+        # 파일명 형식: [폐기물]2024년_05월_거래처명_거래명세표.xlsx
+        filename = TemplateLayout.FILENAME.format(
+            year=year,
+            month=month,
+            vendor_name=self.safe_filename(vendor_name)
+        )
+        self.get_template(vendor_code).render(
+            os.path.join(output_dir, filename),
+            vendor_name,
+            year,
+            month,
+            self.extract_items(vendor_data),
+            **amounts
+        )
+        self.status.vendor_done(vendor_key(vendor_code), len(vendor_data))
+        
+    def read_vendor_templates(self) -> Dict[str, str]:
+        """거래처별 매핑에 지정된 템플릿 파일 경로를 읽습니다."""
+        if VendorSchema.TEMPLATE not in self.vendor_mapping:
+            return {}
             
+        base_dir = os.path.dirname(self.state.template_file.get())
+        vendor_templates = {}
+        for code, name in zip(self.vendor_mapping['거래처코드'], self.vendor_mapping[VendorSchema.TEMPLATE]):
+            if pd.isna(name) or not str(name).strip():
+                continue
+            path = os.path.join(base_dir, str(name).strip())
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"거래처 {code}의 템플릿 파일이 없습니다: {path}")
+            vendor_templates.setdefault(vendor_key(code), path)
+        return vendor_templates
+        
+    def get_template(self, vendor_code) -> CompiledTemplate:
+        """거래처에 지정된 템플릿을 반환합니다. 지정되지 않으면 기본 템플릿을 사용합니다."""
+        path = self.vendor_templates.get(vendor_key(vendor_code))
+        if path is None:
+            return self.template
+        return self.templates.get(path)
+        
+    def open_aggregates(self):
+        """거래처별 누계 저장소를 엽니다. 열 수 없으면 누계 없이 진행합니다."""
+        self.close_aggregates()
+        self.recorded_vendors = set()
+        self.report_period = None
+        try:
+            self.aggregates = AggregateStore(Storage.AGGREGATE_DB)
+        except Exception as e:
+            self.report_error(f"누계 저장소를 열 수 없습니다: {e}")
+            self.aggregates = None
+            
+    def close_aggregates(self):
+        """누계 저장소의 변경 내용을 저장하고 닫습니다."""
+        if self.aggregates:
+            try:
+                self.aggregates.close()
+            except Exception as e:
+                self.report_error(f"누계 저장소 저장 오류: {e}")
+        self.aggregates = None
+        
+    def record_aggregates(self, key: str, vendor_data: pd.DataFrame,
+                          year: int, month: int) -> Dict[str, Optional[float]]:
+        """거래처의 당월 집계를 저장하고 거래명세서에 기록할 전월/누계 금액을 반환합니다."""
+        if not self.aggregates:
+            return {}
+            
+        self.aggregates.record(key, vendor_data)
+        self.recorded_vendors.add(key)
+        self.report_period = (year, month)
+        
+        # 기록할 셀 위치는 거래처 템플릿마다 다르므로 값만 반환
+        return {
+            'prior_month_amount': self.aggregates.month_amount(key, *prior_month(year, month)),
+            'ytd_amount': self.aggregates.ytd_amount(key, year, month),
+        }
+        
+    def write_summary_report(self):
+        """이번 실행에서 처리한 거래처의 당월/전월/누계 요약 보고서를 저장합니다."""
+        if not self.aggregates or not self.report_period:
+            return
+            
+        try:
+            year, month = self.report_period
+            summary = self.aggregates.summary(year, month, sorted(self.recorded_vendors))
+            vendor_names = self.get_vendor_names(self.vendor_mapping)
+            summary.insert(1, '거래처명', summary['거래처코드'].map(vendor_names))
+            
+            filename = Storage.SUMMARY_FILENAME.format(year=year, month=month)
+            summary.to_excel(
+                os.path.join(self.state.output_dir.get(), filename),
+                index=False,
+                engine='openpyxl'
+            )
+        except Exception as e:
+            self.report_error(f"요약 보고서 작성 오류: {e}")
+        
+    def extract_items(self, vendor_data: pd.DataFrame) -> List[Tuple]:
+        """템플릿 거래 내역 열 순서대로 행 값을 추출합니다."""
+        columns = list(TemplateLayout.ITEM_COLUMNS)
+        items = vendor_data.reindex(columns=columns)
+        items = items.astype(object).where(items.notna(), None)
+        return list(items.itertuples(index=False, name=None))
+        
+    @staticmethod
+    def safe_filename(name) -> str:
+        """파일명에 사용할 수 없는 문자를 제거합니다."""
+        return "".join("_" if c in '\\/:*?"<>|' else c for c in str(name)).strip()
+        
     def process_files(self) -> bool:
         """엑셀 파일들을 처리합니다."""
+        self.status.start_run()
         try:
             # 취소 상태 확인
             if not self.state.is_processing or self.state.was_cancelled:
@@ -133,16 +427,8 @@ class ExcelProcessor:
                 return False
                 
             # 1. 입력 파일 읽기
-            if not self.read_input_files():
-                return False
-                
-            # 취소 상태 확인
-            if not self.state.is_processing or self.state.was_cancelled:
-                print("작업이 취소되었습니다.")
-                return False
-                
-            # 2. 자동화 대상 필터링
-            if not self.filter_automation_targets():
+            stream = self.should_stream()
+            if not self.read_input_files(stream):
                 return False
                 
             # 취소 상태 확인
@@ -150,17 +436,44 @@ class ExcelProcessor:
                 print("작업이 취소되었습니다.")
                 return False
                 
-            # 3. 거래명세서 생성
-            if not self.generate_statements():
-                return False
-                
+            # 누계 저장소 열기
+            self.open_aggregates()
+            
+            if stream:
+                # 미리 읽은 데이터가 없으면 거래처 단위로 읽으면서 바로 생성
+                if not self.stream_statements():
+                    return False
+            else:
+                # 2. 자동화 대상 필터링
+                if not self.filter_automation_targets():
+                    return False
+                    
+                # 취소 상태 확인
+                if not self.state.is_processing or self.state.was_cancelled:
+                    print("작업이 취소되었습니다.")
+                    return False
+                    
+                # 3. 거래명세서 생성
+                if not self.generate_statements():
+                    return False
+                    
+            # 4. 누계 요약 보고서 작성
+            self.status.start_stage("summary")
+            self.report_progress(95, "누계 요약 보고서 작성 중...")
+            self.write_summary_report()
+            
             # 최종 취소 상태 확인
             if not self.state.is_processing or self.state.was_cancelled:
                 print("작업이 취소되었습니다.")
                 return False
                 
+            self.status.complete()
             return True
             
         except Exception as e:
-            print(f"작업 처리 중 오류 발생: {e}")
-            return False 
\ No newline at end of file
+            self.report_error(f"작업 처리 중 오류 발생: {e}")
+            return False
+            
+        finally:
+            self.close_aggregates()
+            self.status.finish(cancelled=not self.state.is_processing or self.state.was_cancelled)
@@ -0,0 +1,348 @@
+import datetime
+import re
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP, ROUND_UP
+from numbers import Number
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from openpyxl.cell._writer import write_cell
+from openpyxl.comments.comment_sheet import CommentRecord
+from openpyxl.compat import safe_string
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.utils import column_index_from_string
+from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.writer.excel import ExcelWriter
+from openpyxl.xml.functions import Element, SubElement
+
+class FormulaError(Exception):
+    """지원하지 않는 수식이거나 계산할 수 없을 때 발생합니다."""
+
+TOKEN_PATTERN = re.compile(r"""\s*(?:
+    (?P<func>[A-Za-z][A-Za-z0-9.]*)\( |
+    (?P<range>\$?[A-Za-z]{1,3}\$?\d+:\$?[A-Za-z]{1,3}\$?\d+) |
+    (?P<ref>\$?[A-Za-z]{1,3}\$?\d+) |
+    (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?) |
+    (?P<op>[-+*/^%(),])
+)""", re.VERBOSE)
+
+REFERENCE_PATTERN = re.compile(r"\$?([A-Za-z]{1,3})\$?(\d+)")
+
+def _reference(text: str) -> Tuple[int, int]:
+    """셀 주소를 (행, 열) 번호로 변환합니다."""
+    column, row = REFERENCE_PATTERN.fullmatch(text).groups()
+    return int(row), column_index_from_string(column.upper())
+
+def _tokenize(formula: str) -> List[Tuple[str, str]]:
+    """수식을 (종류, 문자열) 토큰 목록으로 나눕니다."""
+    tokens = []
+    position = 0
+    formula = formula.rstrip()
+    while position < len(formula):
+        match = TOKEN_PATTERN.match(formula, position)
+        if not match:
+            raise FormulaError(formula)
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+class _Parser:
+    """사칙연산, 거듭제곱, 백분율, 함수 호출만 지원하는 재귀 하강 파서입니다."""
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self) -> Tuple[Optional[str], Optional[str]]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None, None
+
+    def take(self) -> Tuple[str, str]:
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def expect(self, text: str):
+        if self.take() != ('op', text):
+            raise FormulaError(f"'{text}' 가 필요합니다.")
+
+    def parse(self):
+        node = self.additive()
+        if self.position != len(self.tokens):
+            raise FormulaError("해석할 수 없는 토큰이 남아 있습니다.")
+        return node
+
+    def additive(self):
+        node = self.multiplicative()
+        while self.peek() in (('op', '+'), ('op', '-')):
+            op = self.take()[1]
+            node = ('bin', op, node, self.multiplicative())
+        return node
+
+    def multiplicative(self):
+        node = self.power()
+        while self.peek() in (('op', '*'), ('op', '/')):
+            op = self.take()[1]
+            node = ('bin', op, node, self.power())
+        return node
+
+    def power(self):
+        node = self.unary()
+        while self.peek() == ('op', '^'):
+            self.take()
+            node = ('bin', '^', node, self.unary())
+        return node
+
+    def unary(self):
+        if self.peek() in (('op', '-'), ('op', '+')):
+            op = self.take()[1]
+            operand = self.unary()
+            return ('neg', operand) if op == '-' else operand
+        return self.percent()
+
+    def percent(self):
+        node = self.primary()
+        while self.peek() == ('op', '%'):
+            self.take()
+            node = ('bin', '/', node, ('num', 100))
+        return node
+
+    def primary(self):
+        kind, text = self.take()
+        if kind == 'number':
+            number = float(text)
+            return ('num', int(number) if number.is_integer() else number)
+        if kind == 'ref':
+            return ('ref',) + _reference(text)
+        if kind == 'range':
+            start, end = text.split(':')
+            return ('range',) + _reference(start) + _reference(end)
+        if kind == 'func':
+            name = text.upper()
+            if name not in FUNCTIONS:
+                raise FormulaError(f"지원하지 않는 함수입니다: {name}")
+            args = []
+            if self.peek() != ('op', ')'):
+                args.append(self.additive())
+                while self.peek() == ('op', ','):
+                    self.take()
+                    args.append(self.additive())
+            self.expect(')')
+            return ('func', name, args)
+        if (kind, text) == ('op', '('):
+            node = self.additive()
+            self.expect(')')
+            return node
+        raise FormulaError(f"예상하지 못한 토큰입니다: {text}")
+
+def parse_formula(formula: Any):
+    """'=' 로 시작하는 수식을 구문 트리로 변환합니다. 지원하지 않으면 None 을 반환합니다."""
+    if not isinstance(formula, str) or not formula.startswith('='):
+        return None
+    try:
+        return _Parser(_tokenize(formula[1:])).parse()
+    except FormulaError:
+        return None
+
+def _number(value) -> float:
+    """산술 연산용 숫자로 변환합니다. 빈 셀은 0 입니다."""
+    if value is None or value == "":
+        return 0
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, Number):
+        return value
+    raise FormulaError(f"숫자가 아닌 값입니다: {value!r}")
+
+def _round(value, digits, rounding) -> float:
+    """Excel 과 같이 0 에서 먼 쪽으로 반올림합니다."""
+    digits = int(_number(digits))
+    quantum = Decimal(1).scaleb(-digits)
+    number = Decimal(repr(float(_number(value))))
+    result = float(number.quantize(quantum, rounding=rounding)) if digits >= 0 else float(
+        (number / quantum).quantize(Decimal(1), rounding=rounding) * quantum
+    )
+    return int(result) if result.is_integer() else result
+
+def _sum(evaluator, args) -> float:
+    total = 0
+    for arg in args:
+        if arg[0] in ('range', 'ref'):
+            # 참조한 셀의 문자열·논리값은 무시
+            for value in evaluator.values(arg):
+                if isinstance(value, Number) and not isinstance(value, bool):
+                    total += value
+        else:
+            total += _number(evaluator.evaluate(arg))
+    return total
+
+def _round_function(rounding):
+    def function(evaluator, args):
+        if len(args) != 2:
+            raise FormulaError("인수는 2개여야 합니다.")
+        value, digits = (evaluator.evaluate(arg) for arg in args)
+        return _round(value, digits, rounding)
+    return function
+
+FUNCTIONS: Dict[str, Callable] = {
+    'SUM': _sum,
+    'ROUND': _round_function(ROUND_HALF_UP),
+    'ROUNDUP': _round_function(ROUND_UP),
+    'ROUNDDOWN': _round_function(ROUND_DOWN),
+}
+
+class SheetEvaluator:
+    """시트에 채워진 값으로 수식 셀을 계산합니다. 수식은 미리 해석해 둔 것을 사용합니다."""
+
+    def __init__(self, sheet, formulas: Dict[Tuple[int, int], Any]):
+        self.sheet = sheet
+        self.formulas = formulas
+        self.results: Dict[Tuple[int, int], Any] = {}
+        self.visiting = set()
+
+    def cell_value(self, row: int, column: int):
+        cell = self.sheet._cells.get((row, column))
+        if cell is None:
+            return None
+        if cell.data_type == 'f':
+            return self.result(row, column)
+        return cell._value
+
+    def result(self, row: int, column: int):
+        key = (row, column)
+        if key in self.results:
+            return self.results[key]
+        tree = self.formulas.get(key)
+        if tree is None or key in self.visiting:
+            raise FormulaError(f"계산할 수 없는 셀입니다: {key}")
+        self.visiting.add(key)
+        try:
+            value = self.evaluate(tree)
+        finally:
+            self.visiting.discard(key)
+        if value is None:
+            # Excel 과 같이 빈 셀만 참조하는 수식은 0
+            value = 0
+        elif isinstance(value, float) and value.is_integer():
+            value = int(value)
+        self.results[key] = value
+        return value
+
+    def values(self, node):
+        if node[0] == 'ref':
+            yield self.cell_value(node[1], node[2])
+            return
+        _, row1, col1, row2, col2 = node
+        for row in range(min(row1, row2), max(row1, row2) + 1):
+            for column in range(min(col1, col2), max(col1, col2) + 1):
+                yield self.cell_value(row, column)
+
+    def evaluate(self, node):
+        kind = node[0]
+        if kind == 'num':
+            return node[1]
+        if kind == 'ref':
+            return self.cell_value(node[1], node[2])
+        if kind == 'neg':
+            return -_number(self.evaluate(node[1]))
+        if kind == 'bin':
+            _, op, left, right = node
+            left, right = _number(self.evaluate(left)), _number(self.evaluate(right))
+            if op == '+':
+                return left + right
+            if op == '-':
+                return left - right
+            if op == '*':
+                return left * right
+            if op == '/':
+                if right == 0:
+                    raise FormulaError("0 으로 나눌 수 없습니다.")
+                return left / right
+            result = left ** right
+            if isinstance(result, complex):
+                raise FormulaError("음수의 거듭제곱근은 계산할 수 없습니다.")
+            return result
+        if kind == 'func':
+            return FUNCTIONS[node[1]](self, node[2])
+        raise FormulaError("범위는 함수 인수로만 사용할 수 있습니다.")
+
+    def evaluate_all(self) -> bool:
+        """모든 수식 셀을 계산해 시트에 캐시 값으로 남깁니다. 모두 계산되면 True 를 반환합니다."""
+        complete = True
+        cached_values = {}
+        for (row, column), cell in self.sheet._cells.items():
+            if cell.data_type != 'f':
+                continue
+            try:
+                value = self.result(row, column)
+            except (FormulaError, ArithmeticError, TypeError, ValueError):
+                complete = False
+                continue
+            if isinstance(value, (Number, str)):
+                cached_values[(row, column)] = value
+            else:
+                # 날짜 등 캐시 값으로 기록할 수 없는 결과는 Excel 이 계산하도록 남김
+                complete = False
+        self.sheet.cached_values = cached_values
+        return complete
+
+def _write_formula_cell(xf, cell, value):
+    """수식과 계산해 둔 값을 함께 기록합니다."""
+    attributes = {'r': cell.coordinate}
+    if cell.has_style:
+        attributes['s'] = f"{cell.style_id}"
+    if isinstance(value, bool):
+        attributes['t'] = 'b'
+        value = int(value)
+    elif isinstance(value, str):
+        attributes['t'] = 'str'
+    element = Element('c', attributes)
+    SubElement(element, 'f').text = cell._value[1:]
+    SubElement(element, 'v').text = safe_string(value)
+    xf.write(element)
+
+class _CachedValueWorksheetWriter(WorksheetWriter):
+    """시트의 cached_values 에 있는 수식 셀은 <v> 에 계산 값을 함께 기록합니다."""
+
+    def write_row(self, xf, row, row_idx):
+        cached = getattr(self.ws, 'cached_values', None)
+        if not cached:
+            return super().write_row(xf, row, row_idx)
+
+        attrs = {'r': f"{row_idx}"}
+        attrs.update(self.ws.row_dimensions.get(row_idx, {}))
+        with xf.element("row", attrs):
+            for cell in row:
+                if cell._comment is not None:
+                    self.ws._comments.append(CommentRecord.from_cell(cell))
+                if cell._value is None and not cell.has_style and not cell._comment:
+                    continue
+                key = (cell.row, cell.column)
+                if (key in cached and cell.data_type == 'f' and isinstance(cell._value, str)
+                        and not cell.hyperlink):
+                    _write_formula_cell(xf, cell, cached[key])
+                else:
+                    write_cell(xf, self.ws, cell, cell.has_style)
+
+class _CachedValueExcelWriter(ExcelWriter):
+    def write_worksheet(self, ws):
+        ws._drawing = SpreadsheetDrawing()
+        ws._drawing.charts = ws._charts
+        ws._drawing.images = ws._images
+        writer = _CachedValueWorksheetWriter(ws)
+        writer.write()
+
+        ws._rels = writer._rels
+        self._archive.write(writer.out, ws.path[1:])
+        self.manifest.append(ws)
+        writer.cleanup()
+
+def save_with_cached_values(workbook, path: str):
+    """SheetEvaluator 로 계산한 값을 수식 셀에 함께 기록해 워크북을 저장합니다.
+
+    openpyxl 의 기본 저장 방식은 바꾸지 않으므로 다른 워크북 저장에는 영향이 없습니다.
+    """
+    archive = ZipFile(path, 'w', ZIP_DEFLATED, allowZip64=True)
+    workbook.properties.modified = datetime.datetime.utcnow()
+    _CachedValueExcelWriter(workbook, archive).save()
@@ -0,0 +1,109 @@
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from services.xlsx_reader import ReadCancelled
+
+def file_stamp(path: str) -> Optional[Tuple[float, int]]:
+    """파일 변경 여부 확인용 (수정 시각, 크기)를 반환합니다."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime, stat.st_size)
+
+@dataclass
+class PrefetchSlot:
+    path: str
+    stamp: Optional[Tuple[float, int]]
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    thread: Optional[threading.Thread] = None
+    data: Optional[pd.DataFrame] = None
+
+class InputPrefetcher:
+    """입력 파일을 선택하자마자 백그라운드에서 미리 읽어 둡니다.
+
+    읽어 둔 데이터는 get() 으로 한 번 넘겨주면 보관하지 않습니다.
+    """
+
+    # 읽기를 기다리는 동안 취소 여부를 확인하는 간격 (초)
+    WAIT_INTERVAL = 0.1
+
+    def __init__(self, on_error: Callable[[str], None] = print):
+        self.slots: Dict[str, PrefetchSlot] = {}
+        self.lock = threading.Lock()
+        self.on_error = on_error
+
+    def start(self, key: str, path: str,
+              loader: Callable[[str, Callable[[], bool]], pd.DataFrame],
+              on_ready: Optional[Callable[[str], None]] = None):
+        """파일 읽기를 시작합니다. 같은 키로 진행 중인 작업은 취소합니다."""
+        self.cancel(key)
+        slot = PrefetchSlot(path=path, stamp=file_stamp(path))
+
+        def run():
+            try:
+                data = loader(path, slot.cancel_event.is_set)
+            except ReadCancelled:
+                return
+            except Exception as e:
+                self.on_error(f"파일 미리 읽기 오류: {e}")
+                return
+            if slot.cancel_event.is_set():
+                return
+            slot.data = data
+            if on_ready:
+                on_ready(key)
+
+        slot.thread = threading.Thread(target=run)
+        slot.thread.daemon = True
+        with self.lock:
+            self.slots[key] = slot
+        slot.thread.start()
+
+    def cancel(self, key: str):
+        """진행 중인 미리 읽기를 취소하고 결과를 버립니다."""
+        with self.lock:
+            slot = self.slots.pop(key, None)
+        if slot:
+            slot.cancel_event.set()
+
+    def peek(self, key: str) -> Optional[pd.DataFrame]:
+        """이미 읽기가 끝난 데이터를 기다리지 않고 반환합니다."""
+        with self.lock:
+            slot = self.slots.get(key)
+        return slot.data if slot else None
+
+    def is_ready(self, key: str, path: str) -> bool:
+        """해당 파일을 이미 다 읽어 두었는지 확인합니다."""
+        with self.lock:
+            slot = self.slots.get(key)
+        return slot is not None and slot.path == path and slot.data is not None
+
+    def get(self, key: str, path: str,
+            cancelled: Optional[Callable[[], bool]] = None) -> Optional[pd.DataFrame]:
+        """미리 읽은 데이터를 넘겨주고 보관하지 않습니다. 읽는 중이면 끝날 때까지 기다립니다.
+
+        기다리는 동안 cancelled() 가 True 가 되면 ReadCancelled 를 발생시킵니다. 이때 미리
+        읽기는 계속되므로 다시 시작하면 그 결과를 사용할 수 있습니다.
+        """
+        with self.lock:
+            slot = self.slots.get(key)
+        if slot is None or slot.path != path:
+            return None
+
+        while slot.thread.is_alive():
+            if cancelled and cancelled():
+                raise ReadCancelled(path)
+            slot.thread.join(self.WAIT_INTERVAL)
+
+        with self.lock:
+            if self.slots.get(key) is slot:
+                del self.slots[key]
+        if slot.data is None or slot.stamp != file_stamp(path):
+            # 읽기 실패 또는 그 사이 파일이 변경됨
+            return None
+        return slot.data
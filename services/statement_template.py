@@ -0,0 +1,297 @@
+import math
+from copy import copy, deepcopy
+from dataclasses import dataclass, field, replace
+from io import BytesIO
+from numbers import Number
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from openpyxl import load_workbook
+from openpyxl.cell.cell import Cell
+from openpyxl.drawing.image import Image
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.utils import (
+    column_index_from_string, coordinate_to_tuple, get_column_letter, range_boundaries
+)
+
+from services.formula_eval import SheetEvaluator, parse_formula, save_with_cached_values
+from resources.template_layout import TemplateLayout
+
+@dataclass
+class StatementLayout:
+    """템플릿 한 개의 셀 위치입니다. 기본값은 TemplateLayout 을 따릅니다."""
+    vendor_name_cell: str = TemplateLayout.VENDOR_NAME_CELL
+    period_cell: str = TemplateLayout.PERIOD_CELL
+    page_cell: str = TemplateLayout.PAGE_CELL
+    prior_month_amount_cell: Optional[str] = TemplateLayout.PRIOR_MONTH_AMOUNT_CELL
+    ytd_amount_cell: Optional[str] = TemplateLayout.YTD_AMOUNT_CELL
+    item_start_row: int = TemplateLayout.ITEM_START_ROW
+    items_per_page: int = TemplateLayout.ITEMS_PER_PAGE
+    item_columns: Dict[str, str] = field(default_factory=lambda: dict(TemplateLayout.ITEM_COLUMNS))
+
+    @classmethod
+    def from_workbook(cls, workbook, sheet) -> "StatementLayout":
+        """템플릿에 정의된 이름(TemplateLayout.CELL_NAMES 등)으로 기본 위치를 바꿉니다."""
+        names = {**dict(workbook.defined_names), **dict(sheet.defined_names)}
+
+        def bounds(name: str):
+            defined = names.get(name)
+            if defined is None:
+                return None
+            destinations = list(defined.destinations)
+            if len(destinations) != 1 or destinations[0][0] != sheet.title:
+                raise ValueError(f"템플릿 이름 정의가 올바르지 않습니다: {name}")
+            return range_boundaries(destinations[0][1].replace('$', ''))
+
+        layout = cls()
+        changes = {}
+        for attr, name in TemplateLayout.CELL_NAMES.items():
+            found = bounds(name)
+            if found:
+                min_col, min_row, _, _ = found
+                changes[attr] = f"{get_column_letter(min_col)}{min_row}"
+
+        found = bounds(TemplateLayout.ITEMS_NAME)
+        if found:
+            _, min_row, _, max_row = found
+            if max_row - min_row < 1:
+                # 이어지는 페이지는 첫 행을 이월 행으로 쓰므로 거래 내역 행이 2행 이상 필요
+                raise ValueError(
+                    f"{TemplateLayout.ITEMS_NAME} 범위는 2행 이상이어야 합니다."
+                )
+            changes['item_start_row'] = min_row
+            changes['items_per_page'] = max_row - min_row + 1
+
+        item_columns = dict(layout.item_columns)
+        for column, name in TemplateLayout.ITEM_COLUMN_NAMES.items():
+            found = bounds(name)
+            if found:
+                item_columns[column] = get_column_letter(found[0])
+        changes['item_columns'] = item_columns
+        return replace(layout, **changes)
+
+@dataclass
+class PageLayout:
+    page: int
+    title: str
+    start: int  # 거래 내역 시작 인덱스 (포함)
+    stop: int   # 거래 내역 끝 인덱스 (미포함)
+    rows: range  # 시트에 기록될 행 번호
+    carry_forward: bool  # 첫 행에 앞 페이지까지의 합계를 이월하는지 여부
+    last: bool  # 합계 영역을 남기는 마지막 페이지인지 여부
+
+def plan_pages(title: str, item_count: int,
+               items_per_page: int = TemplateLayout.ITEMS_PER_PAGE,
+               start_row: int = TemplateLayout.ITEM_START_ROW) -> List[PageLayout]:
+    """거래 내역 수에 맞춰 페이지별 행 배치를 미리 계산합니다.
+
+    이어지는 페이지는 첫 행을 이월 행으로 쓰므로 거래 내역을 한 줄 적게 담습니다.
+    """
+    continued_per_page = max(1, items_per_page - 1)
+    if item_count <= items_per_page:
+        total_pages = 1
+    else:
+        total_pages = 1 + math.ceil((item_count - items_per_page) / continued_per_page)
+
+    pages = []
+    stop = 0
+    for page in range(1, total_pages + 1):
+        carry_forward = page > 1
+        start = stop
+        stop = min(start + (continued_per_page if carry_forward else items_per_page), item_count)
+        first_row = start_row + 1 if carry_forward else start_row
+        page_title = title if page == 1 else TemplateLayout.CONTINUATION_TITLE.format(
+            title=title, page=page
+        )
+        pages.append(PageLayout(
+            page=page,
+            title=page_title,
+            start=start,
+            stop=stop,
+            rows=range(first_row, first_row + (stop - start)),
+            carry_forward=carry_forward,
+            last=page == total_pages
+        ))
+    return pages
+
+class CompiledTemplate:
+    """템플릿 워크북을 한 번만 읽어 두고 거래명세서마다 재사용합니다.
+
+    템플릿 셀의 값과 스타일은 컴파일 시점에 한 번만 수집되며, 각 페이지의 셀은
+    복사본 대신 같은 StyleArray 를 참조합니다. 스타일 인덱스가 가리키는 스타일
+    테이블은 템플릿 워크북에 남아 있으므로, 출력 시트는 항상 이 워크북 안에서
+    만들고 저장한 뒤 제거합니다. 날짜 등은 값을 기록할 때 셀 서식이 바뀌므로, 값을 기록하는
+    셀은 _write() 로 스타일을 복사한 뒤 기록해 템플릿의 스타일이 바뀌지 않도록 합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.workbook = load_workbook(path)
+        self.sheet = self.workbook.worksheets[TemplateLayout.SHEET_INDEX]
+        self.title = self.sheet.title
+        self.calc_id = self.workbook.calculation.calcId
+        self.layout = StatementLayout.from_workbook(self.workbook, self.sheet)
+
+        # 셀 값과 스타일을 한 번만 수집
+        self.cells: List[Tuple[int, int, Any, str, Any]] = [
+            (row, col, cell._value, cell.data_type, cell._style)
+            for (row, col), cell in self.sheet._cells.items()
+        ]
+        # 수식은 한 번만 해석해 두고 페이지마다 계산
+        self.formulas = {
+            (row, col): tree
+            for row, col, value, data_type, _ in self.cells
+            if data_type == 'f' and (tree := parse_formula(value)) is not None
+        }
+        self.item_columns = [
+            (column, column_index_from_string(letter))
+            for column, letter in self.layout.item_columns.items()
+        ]
+        # 거래 내역 영역 아래는 합계 영역으로 보고 마지막 페이지에만 남김
+        self.totals_start_row = self.layout.item_start_row + self.layout.items_per_page
+        columns = list(TemplateLayout.ITEM_COLUMNS)
+        self.carry_label_index = columns.index(TemplateLayout.CARRY_FORWARD_LABEL_COLUMN)
+        self.carry_indexes = [columns.index(column) for column in TemplateLayout.CARRY_FORWARD_COLUMNS]
+
+        # 이미지는 저장할 때 원본 스트림이 닫히므로 데이터를 한 번만 읽어 둠
+        self.images = [
+            (image._data(), image.anchor, image.width, image.height)
+            for image in self.sheet._images
+        ]
+
+        # 템플릿 시트는 스타일 원본으로만 남기고 출력 대상에서 제외
+        for sheet in list(self.workbook.worksheets):
+            self.workbook.remove(sheet)
+
+    def _create_page(self, title: str, totals: bool = True):
+        """템플릿 셀을 스타일 참조로 채운 새 시트를 만듭니다. totals 가 아니면 합계 영역 값은 비웁니다."""
+        sheet = self.workbook.create_sheet(title)
+        cells = sheet._cells
+        for row, col, value, data_type, style in self.cells:
+            cell = Cell(sheet, row=row, column=col)
+            if totals or row < self.totals_start_row:
+                cell._value = value
+                cell.data_type = data_type
+            cell._style = style
+            cells[(row, col)] = cell
+
+        for attr in ('row_dimensions', 'column_dimensions'):
+            source = getattr(self.sheet, attr)
+            target = getattr(sheet, attr)
+            for key, dim in source.items():
+                target[key] = copy(dim)
+                target[key].worksheet = sheet
+
+        sheet.sheet_format = copy(self.sheet.sheet_format)
+        sheet.sheet_properties = copy(self.sheet.sheet_properties)
+        sheet.merged_cells = copy(self.sheet.merged_cells)
+        sheet.page_margins = copy(self.sheet.page_margins)
+        sheet.page_setup = copy(self.sheet.page_setup)
+        sheet.print_options = copy(self.sheet.print_options)
+        sheet.HeaderFooter = deepcopy(self.sheet.HeaderFooter)
+
+        # 틀 고정, 눈금선, 확대 비율 (선택된 탭은 render 에서 첫 페이지만 지정)
+        sheet.views = deepcopy(self.sheet.views)
+        sheet.sheet_view.tabSelected = False
+
+        # 인쇄 영역과 인쇄 제목 (시트 이름은 저장할 때 새 시트 이름으로 기록됨)
+        sheet._print_area = copy(self.sheet._print_area)
+        sheet._print_rows = copy(self.sheet._print_rows)
+        sheet._print_cols = copy(self.sheet._print_cols)
+
+        sheet.conditional_formatting = deepcopy(self.sheet.conditional_formatting)
+        sheet.data_validations = deepcopy(self.sheet.data_validations)
+
+        # 로고, 도장 등 이미지 (저장할 때 위치 정보가 바뀌므로 페이지마다 새로 만듦)
+        for data, anchor, width, height in self.images:
+            image = Image(BytesIO(data))
+            image.anchor = deepcopy(anchor)
+            image.width, image.height = width, height
+            sheet._images.append(image)
+        return sheet
+
+    @staticmethod
+    def _write(sheet, row: int, column: int, value: Any):
+        """템플릿과 공유하던 스타일을 복사한 뒤 셀 값을 기록합니다."""
+        cell = sheet.cell(row=row, column=column)
+        if cell._style is not None:
+            cell._style = StyleArray(cell._style)
+        cell.value = value
+
+    def render(self, output_path: str, vendor_name: str, year: int, month: int,
+               items: Sequence[Sequence[Any]],
+               prior_month_amount: Optional[float] = None,
+               ytd_amount: Optional[float] = None) -> int:
+        """거래 내역을 페이지로 나누어 기록하고 저장합니다. 페이지 수를 반환합니다.
+
+        여러 페이지이면 합계 영역은 마지막 페이지에만 남기고, 이어지는 페이지의 첫 행에
+        앞 페이지까지의 금액을 이월해 마지막 페이지의 합계가 전체 거래 내역을 포함하도록 합니다.
+        전월/누계 금액은 마지막 페이지의 해당 셀에만 기록합니다. 수식 셀은 채운 값으로
+        계산해 캐시 값과 함께 저장하며, 모든 수식이 계산되면 현재 계산 엔진의 calcId 를
+        기록해 Excel 이 열 때 재계산하지 않도록 합니다.
+        """
+        cell_layout = self.layout
+        summary_cells = {
+            cell: value for cell, value in (
+                (cell_layout.prior_month_amount_cell, prior_month_amount),
+                (cell_layout.ytd_amount_cell, ytd_amount),
+            )
+            if cell and value is not None
+        }
+        pages = plan_pages(
+            self.title, len(items), cell_layout.items_per_page, cell_layout.item_start_row
+        )
+        sheets = []
+        calculated = True
+        try:
+            for layout in pages:
+                sheet = self._create_page(layout.title, totals=layout.last)
+                sheets.append(sheet)
+                if layout.page == 1:
+                    self.workbook.active = sheet
+                    sheet.sheet_view.tabSelected = True
+
+                self._write(sheet, *coordinate_to_tuple(cell_layout.vendor_name_cell), vendor_name)
+                self._write(
+                    sheet, *coordinate_to_tuple(cell_layout.period_cell),
+                    TemplateLayout.PERIOD_FORMAT.format(year=year, month=month)
+                )
+                if layout.last:
+                    for coordinate, value in summary_cells.items():
+                        self._write(sheet, *coordinate_to_tuple(coordinate), value)
+                if len(pages) > 1:
+                    self._write(
+                        sheet, *coordinate_to_tuple(cell_layout.page_cell),
+                        TemplateLayout.PAGE_FORMAT.format(page=layout.page, total=len(pages))
+                    )
+
+                if layout.carry_forward:
+                    self._write_carry_forward(sheet, items[:layout.start])
+
+                for row, values in zip(layout.rows, items[layout.start:layout.stop]):
+                    for (_, col), value in zip(self.item_columns, values):
+                        self._write(sheet, row, col, value)
+
+                calculated = SheetEvaluator(sheet, self.formulas).evaluate_all() and calculated
+
+            calculation = self.workbook.calculation
+            calculation.fullCalcOnLoad = not calculated
+            calculation.calcId = TemplateLayout.CALC_ID if calculated else self.calc_id
+            save_with_cached_values(self.workbook, output_path)
+        finally:
+            for sheet in sheets:
+                self.workbook.remove(sheet)
+        return len(pages)
+
+    def _write_carry_forward(self, sheet, previous_items: Sequence[Sequence[Any]]):
+        """이어지는 페이지 첫 행에 앞 페이지까지의 금액 합계를 기록합니다."""
+        row = self.layout.item_start_row
+        self._write(
+            sheet, row, self.item_columns[self.carry_label_index][1],
+            TemplateLayout.CARRY_FORWARD_LABEL
+        )
+        for index in self.carry_indexes:
+            total = sum(
+                values[index] for values in previous_items
+                if isinstance(values[index], Number) and not isinstance(values[index], bool)
+            )
+            self._write(sheet, row, self.item_columns[index][1], total)
@@ -0,0 +1,267 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from resources.status_server import StatusServerConfig
+
+class RunStatus:
+    """처리 중인 작업의 단계, 진행 거래처 수, 처리 속도, 마지막 오류를 기록합니다.
+
+    작업 스레드에서 갱신하고 상태 서버 스레드에서 읽으므로 모든 접근은 잠금을 거칩니다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.runs_total = 0
+        self.errors_total = 0
+        self.last_error: Optional[str] = None
+        self.last_error_time: Optional[float] = None
+        self.reset()
+
+    def reset(self):
+        """현재 실행의 상태를 초기화합니다."""
+        self.state = "idle"
+        self.stage: Optional[str] = None
+        self.stage_started: Optional[float] = None
+        self.stage_seconds: Dict[str, float] = {}
+        self.run_started: Optional[float] = None
+        self.run_finished: Optional[float] = None
+        self.last_progress: Optional[float] = None
+        self.progress = 0
+        self.message = ""
+        self.vendor_rows: Dict[str, int] = {}
+        self.vendors_total = 0
+        self.rows_processed = 0
+
+    def start_run(self):
+        """새 실행을 시작합니다."""
+        with self.lock:
+            self.reset()
+            now = time.time()
+            self.state = "running"
+            self.run_started = now
+            self.last_progress = now
+            self.runs_total += 1
+
+    def start_stage(self, stage: str):
+        """다음 단계로 넘어가며 이전 단계의 소요 시간을 기록합니다."""
+        with self.lock:
+            now = time.time()
+            self._end_stage(now)
+            self.stage = stage
+            self.stage_started = now
+            self.last_progress = now
+
+    def _end_stage(self, now: float):
+        if self.stage is not None and self.stage_started is not None:
+            self.stage_seconds[self.stage] = (
+                self.stage_seconds.get(self.stage, 0) + now - self.stage_started
+            )
+        self.stage_started = None
+
+    def update_progress(self, value: float, message: str):
+        """진행률과 상태 메시지를 기록합니다."""
+        with self.lock:
+            self.progress = value
+            self.message = message
+            self.last_progress = time.time()
+
+    def set_vendor_total(self, total: int):
+        """처리할 거래처 수를 기록합니다."""
+        with self.lock:
+            self.vendors_total = total
+
+    def vendor_done(self, vendor_code: str, rows: int):
+        """거래처 한 곳의 거래명세서 작성을 마쳤음을 기록합니다. 다시 작성하면 한 번만 셉니다."""
+        with self.lock:
+            self.rows_processed += rows - self.vendor_rows.get(vendor_code, 0)
+            self.vendor_rows[vendor_code] = rows
+            self.last_progress = time.time()
+
+    def record_error(self, message: str):
+        """마지막 오류를 기록합니다."""
+        with self.lock:
+            self.errors_total += 1
+            self.last_error = message
+            self.last_error_time = time.time()
+
+    def complete(self):
+        """실행이 성공적으로 끝났음을 표시합니다."""
+        with self.lock:
+            self.state = "completed"
+
+    def finish(self, cancelled: bool):
+        """실행을 마칩니다. 완료로 표시되지 않았다면 취소 또는 실패로 기록합니다."""
+        with self.lock:
+            now = time.time()
+            self._end_stage(now)
+            self.stage = None
+            self.run_finished = now
+            if self.state == "running":
+                self.state = "cancelled" if cancelled else "failed"
+
+    def snapshot(self) -> dict:
+        """현재 상태를 JSON 으로 변환할 수 있는 dict 로 반환합니다."""
+        with self.lock:
+            now = time.time()
+            stage_seconds = dict(self.stage_seconds)
+            if self.stage is not None and self.stage_started is not None:
+                stage_seconds[self.stage] = stage_seconds.get(self.stage, 0) + now - self.stage_started
+
+            elapsed = 0.0
+            if self.run_started is not None:
+                elapsed = (self.run_finished or now) - self.run_started
+            since_progress = now - self.last_progress if self.last_progress is not None else None
+            return {
+                "state": self.state,
+                "stage": self.stage,
+                "progress": self.progress,
+                "message": self.message,
+                "vendors_done": len(self.vendor_rows),
+                "vendors_total": self.vendors_total,
+                "rows_processed": self.rows_processed,
+                "rows_per_second": self.rows_processed / elapsed if elapsed > 0 else 0.0,
+                "elapsed_seconds": elapsed,
+                "stage_seconds": stage_seconds,
+                "seconds_since_progress": since_progress,
+                "stalled": (
+                    self.state == "running" and since_progress is not None
+                    and since_progress > StatusServerConfig.STALL_SECONDS
+                ),
+                "runs_total": self.runs_total,
+                "errors_total": self.errors_total,
+                "last_error": self.last_error,
+                "last_error_time": self.last_error_time,
+            }
+
+    def to_prometheus(self) -> str:
+        """현재 상태를 Prometheus 텍스트 형식으로 반환합니다."""
+        snapshot = self.snapshot()
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+                lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+
+        metric("abr_run_info", "gauge", "Current run state and stage.", [
+            ({"state": snapshot["state"], "stage": snapshot["stage"] or ""}, 1)
+        ])
+        metric("abr_progress_percent", "gauge", "Progress shown in the progress bar.", [
+            ({}, snapshot["progress"])
+        ])
+        metric("abr_vendors_done", "gauge", "Vendors whose statements are written.", [
+            ({}, snapshot["vendors_done"])
+        ])
+        metric("abr_vendors_total", "gauge", "Vendors to process in the current run.", [
+            ({}, snapshot["vendors_total"])
+        ])
+        metric("abr_rows_processed", "gauge", "Line items written in the current run.", [
+            ({}, snapshot["rows_processed"])
+        ])
+        metric("abr_rows_per_second", "gauge", "Line items written per second in the current run.", [
+            ({}, round(snapshot["rows_per_second"], 3))
+        ])
+        metric("abr_run_elapsed_seconds", "gauge", "Seconds since the current run started.", [
+            ({}, round(snapshot["elapsed_seconds"], 3))
+        ])
+        metric("abr_stage_duration_seconds", "gauge", "Seconds spent in each stage of the current run.", [
+            ({"stage": stage}, round(seconds, 3))
+            for stage, seconds in snapshot["stage_seconds"].items()
+        ])
+        if snapshot["seconds_since_progress"] is not None:
+            metric("abr_seconds_since_progress", "gauge", "Seconds since the last progress update.", [
+                ({}, round(snapshot["seconds_since_progress"], 3))
+            ])
+        metric("abr_stalled", "gauge", "1 if the running job has made no progress for too long.", [
+            ({}, int(snapshot["stalled"]))
+        ])
+        metric("abr_runs_total", "counter", "Runs started since the program started.", [
+            ({}, snapshot["runs_total"])
+        ])
+        metric("abr_errors_total", "counter", "Errors reported since the program started.", [
+            ({}, snapshot["errors_total"])
+        ])
+        if snapshot["last_error_time"] is not None:
+            metric("abr_last_error_timestamp_seconds", "gauge", "Unix time of the last error.", [
+                ({}, round(snapshot["last_error_time"], 3))
+            ])
+        return "\n".join(lines) + "\n"
+
+def _escape(value) -> str:
+    """Prometheus 레이블 값에 사용할 수 있도록 이스케이프합니다."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+class _StatusRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        status: RunStatus = self.server.status
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body = status.to_prometheus().encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        elif path in ("/", "/status"):
+            body = json.dumps(status.snapshot(), ensure_ascii=False).encode("utf-8")
+            content_type = "application/json; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 요청마다 콘솔에 기록하지 않음
+        pass
+
+class StatusServer:
+    """RunStatus 를 localhost 의 HTTP 엔드포인트(/status, /metrics)로 제공합니다."""
+
+    def __init__(self, status: RunStatus, port: int, host: str = StatusServerConfig.HOST):
+        self.status = status
+        self.host = host
+        self.port = port
+        self.httpd: Optional[ThreadingHTTPServer] = None
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        """백그라운드 스레드에서 서버를 시작합니다. 시작하지 못하면 False 를 반환합니다."""
+        try:
+            self.httpd = ThreadingHTTPServer((self.host, self.port), _StatusRequestHandler)
+        except OSError as e:
+            print(f"상태 서버를 시작할 수 없습니다: {e}")
+            return False
+        self.httpd.daemon_threads = True
+        self.httpd.status = self.status
+        self.port = self.httpd.server_address[1]
+
+        self.thread = threading.Thread(target=self.httpd.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return True
+
+    def stop(self):
+        """서버를 종료합니다."""
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+def start_status_server(status: RunStatus) -> Optional[StatusServer]:
+    """환경 변수에 포트가 설정되어 있으면 상태 서버를 시작합니다."""
+    if not StatusServerConfig.PORT:
+        return None
+    try:
+        port = int(StatusServerConfig.PORT)
+    except ValueError:
+        print(f"상태 서버 포트가 올바르지 않습니다: {StatusServerConfig.PORT}")
+        return None
+
+    server = StatusServer(status, port)
+    return server if server.start() else None
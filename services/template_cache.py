@@ -0,0 +1,38 @@
+import os
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from services.input_prefetcher import file_stamp
+from services.statement_template import CompiledTemplate
+from resources.template_layout import TemplateLayout
+
+class TemplateCache:
+    """컴파일된 템플릿을 최근에 사용한 순서로 정해진 개수만큼 보관합니다.
+
+    같은 파일이라도 수정 시각이나 크기가 바뀌면 다시 컴파일합니다. 처리기와 함께
+    유지되므로 한 번의 실행 안에서뿐 아니라 다음 실행에서도 재사용됩니다.
+    """
+
+    def __init__(self, max_size: int = TemplateLayout.CACHE_SIZE):
+        self.max_size = max_size
+        self.templates: "OrderedDict[str, Tuple[Optional[Tuple[float, int]], CompiledTemplate]]" = OrderedDict()
+
+    def get(self, path: str) -> CompiledTemplate:
+        """템플릿을 반환합니다. 처음 사용하거나 변경된 파일이면 컴파일합니다."""
+        path = os.path.abspath(path)
+        stamp = file_stamp(path)
+        entry = self.templates.get(path)
+        if entry and entry[0] == stamp:
+            self.templates.move_to_end(path)
+            return entry[1]
+
+        template = CompiledTemplate(path)
+        self.templates[path] = (stamp, template)
+        self.templates.move_to_end(path)
+        while len(self.templates) > self.max_size:
+            self.templates.popitem(last=False)
+        return template
+
+    def clear(self):
+        """보관 중인 템플릿을 모두 버립니다."""
+        self.templates.clear()
@@ -0,0 +1,59 @@
+from numbers import Number
+from typing import Callable, Iterator, Optional, Set, Tuple
+
+import pandas as pd
+
+from services.xlsx_reader import iter_xlsx_rows, rows_to_frame
+from resources.schema import MonthlySchema
+
+class UnsortedExport(Exception):
+    """월별 거래명세서가 거래처코드 순으로 정렬되어 있지 않을 때 발생합니다."""
+
+def vendor_key(code) -> str:
+    """거래처코드를 비교용 문자열로 변환합니다. 스트리밍과 전체 읽기 모두 이 규칙으로 비교합니다.
+
+    숫자 셀은 정수 형태로(빈 칸이 섞인 열에서 읽힌 123.0 → "123"), 문자열 셀은 앞뒤 공백만
+    제거합니다. "00123" 처럼 숫자로 보이는 문자열은 숫자로 바꾸지 않으므로 "0012" 와 "012" 는
+    다른 거래처입니다. 빈 값은 "" 입니다.
+    """
+    if isinstance(code, str):
+        return code.strip()
+    if code is None or pd.isna(code):
+        return ""
+    if isinstance(code, Number) and not isinstance(code, bool) and float(code).is_integer():
+        return str(int(code))
+    return str(code).strip()
+
+def iter_vendor_groups(path: str, targets: Set[str],
+                       cancelled: Optional[Callable[[], bool]] = None
+                       ) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """거래처코드 순으로 정렬된 월별 거래명세서를 한 행씩 읽어 거래처별 묶음을 반환합니다.
+
+    거래처코드가 바뀌는 즉시 이전 거래처의 묶음을 반환하며, 자동화 대상(targets)이
+    아닌 거래처의 행은 보관하지 않습니다. 이미 지나간 거래처코드가 다시 나타나면
+    UnsortedExport 를 발생시킵니다.
+    """
+    rows = iter_xlsx_rows(path, MonthlySchema.COLUMNS, cancelled)
+    header = next(rows)
+    key_index = header.index(MonthlySchema.VENDOR_CODE)
+
+    seen: Set[str] = set()
+    current = None
+    group = []
+    for row in rows:
+        key = vendor_key(row[key_index])
+        if not key:
+            continue
+        if key != current:
+            if group:
+                yield current, rows_to_frame(header, group)
+            if key in seen:
+                raise UnsortedExport(key)
+            seen.add(key)
+            current = key
+            group = []
+        if key in targets:
+            group.append(row)
+
+    if group:
+        yield current, rows_to_frame(header, group)
@@ -0,0 +1,335 @@
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+from openpyxl.styles.numbers import (
+    BUILTIN_FORMATS,
+    is_date_format,
+    is_timedelta_format,
+)
+from openpyxl.utils.datetime import (
+    CALENDAR_MAC_1904,
+    WINDOWS_EPOCH,
+    from_excel,
+    from_ISO8601,
+)
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+SHEET_DATA_TAG = MAIN_NS + "sheetData"
+ROW_TAG = MAIN_NS + "row"
+CELL_TAG = MAIN_NS + "c"
+VALUE_TAG = MAIN_NS + "v"
+INLINE_TAG = MAIN_NS + "is"
+SI_TAG = MAIN_NS + "si"
+TEXT_TAG = MAIN_NS + "t"
+RUN_TAG = MAIN_NS + "r"
+
+class ReadCancelled(Exception):
+    """읽기 도중 취소되었을 때 발생합니다."""
+
+def _column_index(reference: str) -> int:
+    """셀 주소(예: AB12)에서 열 번호(1부터 시작)를 계산합니다."""
+    index = 0
+    for char in reference:
+        if char.isdigit():
+            break
+        index = index * 26 + (ord(char.upper()) - 64)
+    return index
+
+def _text_content(node) -> str:
+    """<si>/<is> 요소에서 서식을 제외한 문자열을 추출합니다."""
+    snippets = []
+    for child in node:
+        if child.tag == TEXT_TAG:
+            snippets.append(child.text or "")
+        elif child.tag == RUN_TAG:
+            snippets.append(child.findtext(TEXT_TAG) or "")
+    return "".join(snippets)
+
+def rows_to_frame(header: List, rows: List[List]) -> pd.DataFrame:
+    """변환된 셀 값 목록을 read_excel 과 같은 규칙으로 DataFrame 으로 만듭니다."""
+    if not header:
+        return pd.DataFrame()
+    return TextParser([header] + rows, header=0, skip_blank_lines=False).read()
+
+class XlsxColumnReader:
+    """xlsx 파일의 첫 번째 시트를 iterparse 로 읽어 열 단위 배열로 변환합니다.
+
+    pandas.read_excel(engine='openpyxl') 와 같은 규칙으로 셀 값을 변환하므로,
+    columns 를 지정하지 않으면 동일한 DataFrame 을 반환합니다. columns 를 지정하면
+    해당 헤더의 열만 보관하고 나머지 열의 값은 변환하지 않습니다. cancelled 가
+    True 를 반환하면 다음 행에서 ReadCancelled 를 발생시킵니다.
+    """
+
+    def __init__(self, path: str, columns: Optional[Iterable[str]] = None,
+                 cancelled: Optional[Callable[[], bool]] = None):
+        self.path = path
+        self.columns = set(columns) if columns is not None else None
+        self.cancelled = cancelled
+
+    def read(self) -> pd.DataFrame:
+        """DataFrame 을 반환합니다."""
+        header, data = self._read_sheet()
+        return rows_to_frame(header, [list(row) for row in zip(*data)])
+
+    def iter_rows(self) -> Iterator[List]:
+        """헤더 행을 먼저 반환한 뒤, 값이 있는 데이터 행을 열 순서대로 하나씩 반환합니다."""
+        rows = self._iter_sheet(detach_rows=True)
+        header: Dict[int, object] = {}
+        ordered: Optional[List[int]] = None
+        for row_number, values, has_data in rows:
+            if row_number == 1:
+                header = values
+                continue
+            if ordered is None:
+                ordered = self._select_header(header)
+                yield [header[col] for col in ordered]
+            if has_data:
+                yield [values.get(col, "") for col in ordered]
+        if ordered is None:
+            yield [header[col] for col in self._select_header(header)]
+
+    def _select_header(self, header: Dict[int, object]) -> List[int]:
+        """보관할 헤더 열 번호를 정하고 이후 행에서는 그 열만 변환하도록 설정합니다."""
+        if self.columns is not None:
+            self._keep = {col for col, name in header.items() if name in self.columns}
+            return sorted(self._keep)
+        return sorted(header)
+
+    def _read_workbook(self, archive: zipfile.ZipFile) -> Tuple[str, object]:
+        """첫 번째 시트의 경로와 날짜 기준일을 읽습니다."""
+        workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+        properties = workbook.find(MAIN_NS + "workbookPr")
+        epoch = WINDOWS_EPOCH
+        if properties is not None and properties.get("date1904") in ("1", "true"):
+            epoch = CALENDAR_MAC_1904
+
+        sheet = workbook.find(f"{MAIN_NS}sheets/{MAIN_NS}sheet")
+        rel_id = sheet.get(REL_NS + "id")
+        rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+        for rel in rels.iter(PKG_REL_NS + "Relationship"):
+            if rel.get("Id") == rel_id:
+                target = rel.get("Target")
+                if target.startswith("/"):
+                    return target.lstrip("/"), epoch
+                return posixpath.normpath(posixpath.join("xl", target)), epoch
+        raise KeyError(f"시트 경로를 찾을 수 없습니다: {rel_id}")
+
+    def _read_styles(self, archive: zipfile.ZipFile) -> Tuple[Set[int], Set[int]]:
+        """날짜/시간 서식이 적용된 셀 스타일 번호를 찾습니다."""
+        date_styles: Set[int] = set()
+        timedelta_styles: Set[int] = set()
+        if "xl/styles.xml" not in archive.namelist():
+            return date_styles, timedelta_styles
+
+        styles = ET.fromstring(archive.read("xl/styles.xml"))
+        custom = {
+            int(fmt.get("numFmtId")): fmt.get("formatCode")
+            for fmt in styles.iter(MAIN_NS + "numFmt")
+        }
+        cell_xfs = styles.find(MAIN_NS + "cellXfs")
+        if cell_xfs is None:
+            return date_styles, timedelta_styles
+
+        for idx, xf in enumerate(cell_xfs.iter(MAIN_NS + "xf")):
+            fmt_id = int(xf.get("numFmtId", 0))
+            fmt = custom.get(fmt_id, BUILTIN_FORMATS.get(fmt_id))
+            if fmt is None:
+                continue
+            if is_date_format(fmt):
+                date_styles.add(idx)
+            if is_timedelta_format(fmt):
+                timedelta_styles.add(idx)
+        return date_styles, timedelta_styles
+
+    def _read_shared_strings(self, archive: zipfile.ZipFile) -> List[str]:
+        """공유 문자열 테이블을 읽습니다."""
+        strings: List[str] = []
+        if "xl/sharedStrings.xml" not in archive.namelist():
+            return strings
+
+        with archive.open("xl/sharedStrings.xml") as source:
+            for _, node in ET.iterparse(source):
+                if node.tag == SI_TAG:
+                    strings.append(_text_content(node).replace("x005F_", ""))
+                    node.clear()
+        return strings
+
+    def _iter_sheet(self, detach_rows: bool = False) -> Iterator[Tuple[int, Dict[int, object], bool]]:
+        """시트를 한 행씩 읽어 (행 번호, 열 번호별 값, 값 존재 여부)를 반환합니다.
+
+        self._keep 이 설정되면 그 이후 행에서는 해당 열의 값만 변환합니다. detach_rows 이면
+        처리한 행 요소를 트리에서 떼어 내 행 수와 관계없이 메모리 사용량을 일정하게 유지합니다.
+        전체를 읽을 때는 값 자체가 행 수만큼 쌓이므로, 더 빠른 end 이벤트만 사용합니다.
+        """
+        self._keep = None
+        with zipfile.ZipFile(self.path) as archive:
+            sheet_path, epoch = self._read_workbook(archive)
+            date_styles, timedelta_styles = self._read_styles(archive)
+            strings = self._read_shared_strings(archive)
+            with archive.open(sheet_path) as source:
+                yield from self._parse_rows(
+                    source, strings, epoch, date_styles, timedelta_styles, detach_rows
+                )
+
+    def _parse_rows(self, source, strings, epoch, date_styles, timedelta_styles,
+                    detach_rows: bool = False):
+        """시트 XML 을 iterparse 로 읽어 행 단위로 셀 값을 변환합니다."""
+        expected_row = 1
+        column_cache: Dict[str, int] = {}
+
+        def convert(cell):
+            cell_type = cell.get("t", "n")
+            if cell_type == "inlineStr":
+                child = cell.find(INLINE_TAG)
+                return "" if child is None else _text_content(child)
+
+            value = cell.findtext(VALUE_TAG)
+            if not value:
+                return ""
+            if cell_type == "n":
+                if "." in value or "E" in value or "e" in value:
+                    number = float(value)
+                    integer = int(number)
+                    number = integer if integer == number else number
+                else:
+                    number = int(value)
+                style = int(cell.get("s", 0))
+                if style in date_styles:
+                    try:
+                        return from_excel(number, epoch,
+                                          timedelta=style in timedelta_styles)
+                    except (OverflowError, ValueError):
+                        return np.nan
+                return number
+            if cell_type == "s":
+                return strings[int(value)]
+            if cell_type == "b":
+                return bool(int(value))
+            if cell_type == "e":
+                return np.nan
+            if cell_type == "d":
+                return from_ISO8601(value)
+            return value
+
+        sheet_data = None
+        events = ("start", "end") if detach_rows else ("end",)
+        for event, node in ET.iterparse(source, events=events):
+            tag = node.tag
+            if tag != ROW_TAG:
+                # 처리한 행을 떼어 낼 수 있도록 sheetData 요소를 기억
+                if tag == SHEET_DATA_TAG and event == "start":
+                    sheet_data = node
+                continue
+            if event == "start":
+                continue
+            if self.cancelled is not None and self.cancelled():
+                raise ReadCancelled(self.path)
+
+            row_number = int(node.get("r", expected_row))
+            expected_row = row_number + 1
+
+            values: Dict[int, object] = {}
+            has_data = False
+            column = 0
+            for cell in node.iter(CELL_TAG):
+                reference = cell.get("r")
+                if reference:
+                    letters = reference.rstrip("0123456789")
+                    column = column_cache.get(letters)
+                    if column is None:
+                        column = column_cache[letters] = _column_index(letters)
+                else:
+                    column += 1
+                keep = self._keep
+                if keep is None or column in keep:
+                    value = convert(cell)
+                    values[column] = value
+                    has_data = has_data or value != ""
+                elif not has_data:
+                    # 보관하지 않는 열도 빈 행 판단에는 포함
+                    has_data = convert(cell) != ""
+            # 처리한 행의 셀은 바로 버리고, 가능하면 행 요소도 sheetData 에서 떼어 냄
+            node.clear()
+            if sheet_data is not None:
+                sheet_data.remove(node)
+
+            yield row_number, values, has_data
+
+    def _read_sheet(self) -> Tuple[List, List[List]]:
+        """행 단위로 읽은 값 중 필요한 열만 열 배열에 쌓습니다."""
+        header: Dict[int, object] = {}
+        arrays: Dict[int, List] = {}
+        row_count = 0       # 헤더 이후 기록된 행 수
+        last_with_data = 0  # 값이 있는 마지막 행까지의 행 수 (뒤쪽 빈 행 제거용)
+        header_done = False
+
+        for row_number, values, has_data in self._iter_sheet():
+            if row_number == 1:
+                header = values
+                continue
+            if not header_done:
+                header_done = True
+                if self.columns is not None:
+                    keep = set(self._select_header(header))
+                    header = {col: header[col] for col in keep}
+                    values = {col: value for col, value in values.items() if col in keep}
+                    arrays = {col: [] for col in keep}
+
+            # 누락된 행은 빈 행으로 채움
+            gap = row_number - 2 - row_count
+            if gap > 0:
+                for array in arrays.values():
+                    array.extend([""] * gap)
+                row_count += gap
+
+            for column, value in values.items():
+                array = arrays.get(column)
+                if array is None:
+                    array = arrays[column] = [""] * row_count
+                array.append(value)
+            for column, array in arrays.items():
+                if column not in values:
+                    array.append("")
+            row_count += 1
+            if has_data:
+                last_with_data = row_count
+
+        if not header_done and self.columns is not None:
+            header = {col: name for col, name in header.items() if name in self.columns}
+
+        # 값이 있는 마지막 열까지를 표 너비로 사용
+        if self.columns is not None:
+            columns = set(header)
+        else:
+            used = {col for col, name in header.items() if name != ""}
+            used |= {
+                col for col, array in arrays.items()
+                if any(value != "" for value in array[:last_with_data])
+            }
+            columns = set(range(1, max(used) + 1)) if used else set()
+
+        ordered = sorted(columns)
+        names = [header.get(col, "") for col in ordered]
+        data = [
+            arrays.get(col, [""] * last_with_data)[:last_with_data]
+            for col in ordered
+        ]
+        return names, data
+
+def iter_xlsx_rows(path: str, columns: Optional[Iterable[str]] = None,
+                   cancelled: Optional[Callable[[], bool]] = None) -> Iterator[List]:
+    """xlsx 파일을 한 행씩 읽습니다. 첫 번째 값은 헤더 행입니다."""
+    return XlsxColumnReader(path, columns, cancelled).iter_rows()
+
+def read_xlsx_columns(path: str, columns: Optional[Iterable[str]] = None,
+                      cancelled: Optional[Callable[[], bool]] = None) -> pd.DataFrame:
+    """xlsx 파일을 열 단위로 빠르게 읽어 DataFrame 으로 반환합니다."""
+    return XlsxColumnReader(path, columns, cancelled).read()
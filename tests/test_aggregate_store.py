@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from services.aggregate_store import AggregateStore, prior_month
+
+def rows(year, month, amounts, waste_type="폐지"):
+    return pd.DataFrame({
+        '년': year,
+        '월': month,
+        '폐기물종류': waste_type,
+        '수량': 1,
+        '공급가액': amounts,
+    })
+
+@pytest.fixture
+def store(tmp_path):
+    store = AggregateStore(str(tmp_path / "aggregates.db"))
+    yield store
+    store.close()
+
+def test_prior_month_of_january_is_previous_december():
+    assert prior_month(2025, 1) == (2024, 12)
+    assert prior_month(2025, 5) == (2025, 4)
+
+def test_rerun_replaces_month(store):
+    store.record("V001", rows(2025, 5, [100, 200]))
+    store.record("V001", rows(2025, 5, [300]))
+    assert store.month_amount("V001", 2025, 5) == 300
+    assert store.ytd_amount("V001", 2025, 5) == 300
+
+def test_unrecorded_month_has_no_amount(store):
+    store.record("V001", rows(2025, 5, [100]))
+    assert store.month_amount("V001", 2025, 4) is None
+    assert store.ytd_amount("V001", 2025, 4) is None
+    assert store.month_amount("V002", 2025, 5) is None
+
+def test_january_uses_previous_december(store):
+    store.record("V001", rows(2024, 12, [500]))
+    store.record("V001", rows(2025, 1, [100]))
+    assert store.month_amount("V001", *prior_month(2025, 1)) == 500
+    # 누계는 해당 연도만
+    assert store.ytd_amount("V001", 2025, 1) == 100
+
+    summary = store.summary(2025, 1)
+    assert summary[['당월금액', '전월금액', '누계금액']].values.tolist() == [[100, 500, 100]]
+
+def test_summary_filters_by_vendor(store):
+    store.record("V001", rows(2025, 4, [50]))
+    store.record("V001", rows(2025, 5, [100]))
+    store.record("V002", rows(2025, 5, [200]))
+
+    summary = store.summary(2025, 5, ["V001"])
+    assert list(summary['거래처코드']) == ["V001"]
+    assert summary[['당월금액', '전월금액', '누계금액']].values.tolist() == [[100, 50, 150]]
+    assert list(store.summary(2025, 5)['거래처코드']) == ["V001", "V002"]
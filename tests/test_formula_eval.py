@@ -0,0 +1,102 @@
+from decimal import ROUND_DOWN, ROUND_HALF_UP, ROUND_UP
+
+import openpyxl.cell._writer as cell_writer
+import openpyxl.worksheet._writer as worksheet_writer
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from services.formula_eval import SheetEvaluator, _round, parse_formula, save_with_cached_values
+
+def evaluate(values):
+    """{셀 주소: 값} 으로 시트를 만들고 모든 수식을 계산합니다."""
+    sheet = Workbook().active
+    for coordinate, value in values.items():
+        sheet[coordinate] = value
+    formulas = {
+        key: parse_formula(cell.value)
+        for key, cell in sheet._cells.items()
+        if cell.data_type == 'f'
+    }
+    formulas = {key: tree for key, tree in formulas.items() if tree is not None}
+    complete = SheetEvaluator(sheet, formulas).evaluate_all()
+    return sheet, complete
+
+def test_parse_formula_builds_tree():
+    assert parse_formula("=A1+2*$B$2") == (
+        'bin', '+', ('ref', 1, 1), ('bin', '*', ('num', 2), ('ref', 2, 2))
+    )
+    assert parse_formula("=sum(G9:G33)") == ('func', 'SUM', [('range', 9, 7, 33, 7)])
+    assert parse_formula("=-10%") == ('neg', ('bin', '/', ('num', 10), ('num', 100)))
+
+@pytest.mark.parametrize("value", [None, 10, "text", "=VLOOKUP(A1,B:C,2)", "=A1+", "=Sheet2!A1"])
+def test_parse_formula_rejects_unsupported(value):
+    assert parse_formula(value) is None
+
+@pytest.mark.parametrize("value, digits, rounding, expected", [
+    (2.5, 0, ROUND_HALF_UP, 3),
+    (-2.5, 0, ROUND_HALF_UP, -3),
+    (1.005, 2, ROUND_HALF_UP, 1.01),
+    (1250, -2, ROUND_HALF_UP, 1300),
+    (1.21, 1, ROUND_UP, 1.3),
+    (-1.29, 1, ROUND_DOWN, -1.2),
+    (None, 0, ROUND_HALF_UP, 0),
+])
+def test_round_matches_excel(value, digits, rounding, expected):
+    assert _round(value, digits, rounding) == expected
+
+def test_evaluator_computes_chained_formulas():
+    sheet, complete = evaluate({
+        "D9": 3, "F9": 500, "H9": "=D9*F9",
+        "D10": 2, "F10": 250, "H10": "=D10*F10",
+        "C11": "합계", "H12": "=SUM(C9:H11)",
+        "H13": "=ROUND(H12*0.1,0)",
+        "H14": "=H12+H13",
+    })
+    assert complete
+    assert sheet.cached_values[(9, 8)] == 1500
+    assert sheet.cached_values[(12, 8)] == 2000 + 3 + 500 + 2 + 250
+    assert sheet.cached_values[(13, 8)] == 276
+    assert sheet.cached_values[(14, 8)] == 3031
+
+def test_evaluator_treats_empty_reference_as_zero():
+    sheet, complete = evaluate({"A1": "=H99", "A2": "=H99+1"})
+    assert complete
+    assert sheet.cached_values == {(1, 1): 0, (2, 1): 1}
+
+@pytest.mark.parametrize("values", [
+    {"A1": "=A2", "A2": "=A1"},
+    {"A1": "=1/0"},
+    {"A1": "텍스트", "A2": "=A1*2"},
+    {"A1": "=VLOOKUP(1,B1:C2,2)"},
+])
+def test_evaluator_leaves_uncomputable_formulas(values):
+    sheet, complete = evaluate(values)
+    assert not complete
+    assert sheet.cached_values == {}
+
+def test_cached_values_survive_save_and_reload(tmp_path):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet["A1"] = 10
+    sheet["A2"] = "거래처"
+    for coordinate, value in {
+        "B1": "=A1*2.5", "B2": "=H99", "B3": "=A2", "B4": "=SUM(A1:A3)",
+    }.items():
+        sheet[coordinate] = value
+    formulas = {
+        key: parse_formula(cell.value)
+        for key, cell in sheet._cells.items()
+        if cell.data_type == 'f'
+    }
+    assert SheetEvaluator(sheet, formulas).evaluate_all()
+
+    path = tmp_path / "cached.xlsx"
+    save_with_cached_values(workbook, str(path))
+
+    values = load_workbook(path, data_only=True).active
+    assert [values[c].value for c in ("B1", "B2", "B3", "B4")] == [25, 0, "거래처", 10]
+    formulas = load_workbook(path).active
+    assert formulas["B4"].value == "=SUM(A1:A3)"
+
+def test_default_openpyxl_writer_is_untouched():
+    assert worksheet_writer.write_cell is cell_writer.write_cell
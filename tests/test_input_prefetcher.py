@@ -0,0 +1,113 @@
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+from services.input_prefetcher import InputPrefetcher
+from services.xlsx_reader import ReadCancelled
+
+class FakeLoader:
+    """release() 가 호출될 때까지 기다렸다가 경로를 담은 DataFrame 을 반환합니다."""
+
+    def __init__(self, error=None):
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.cancelled_seen = threading.Event()
+        self.error = error
+
+    def __call__(self, path, cancelled):
+        self.started.set()
+        self.gate.wait(5)
+        if cancelled():
+            self.cancelled_seen.set()
+            raise ReadCancelled(path)
+        if self.error:
+            raise self.error
+        return pd.DataFrame({'path': [path]})
+
+    def release(self):
+        self.gate.set()
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "monthly.xlsx"
+    path.write_bytes(b"data")
+    return str(path)
+
+def test_get_hands_data_over_once(input_file):
+    prefetcher = InputPrefetcher()
+    loader = FakeLoader()
+    ready = []
+    prefetcher.start('monthly', input_file, loader, ready.append)
+    assert not prefetcher.is_ready('monthly', input_file)
+
+    loader.release()
+    data = prefetcher.get('monthly', input_file)
+    assert list(data['path']) == [input_file]
+    assert ready == ['monthly']
+    # 한 번 넘겨준 데이터는 보관하지 않음
+    assert prefetcher.get('monthly', input_file) is None
+    assert prefetcher.peek('monthly') is None
+
+def test_get_ignores_other_path(input_file, tmp_path):
+    prefetcher = InputPrefetcher()
+    loader = FakeLoader()
+    loader.release()
+    prefetcher.start('monthly', input_file, loader)
+    assert prefetcher.get('monthly', str(tmp_path / "other.xlsx")) is None
+    assert prefetcher.get('monthly', input_file) is not None
+
+def test_changed_file_is_not_used(input_file):
+    prefetcher = InputPrefetcher()
+    loader = FakeLoader()
+    prefetcher.start('monthly', input_file, loader)
+    loader.started.wait(5)
+
+    with open(input_file, "ab") as f:
+        f.write(b" changed")
+    stat = os.stat(input_file)
+    os.utime(input_file, (stat.st_atime, stat.st_mtime + 10))
+
+    loader.release()
+    assert prefetcher.get('monthly', input_file) is None
+
+def test_restart_cancels_previous_read(input_file, tmp_path):
+    other = tmp_path / "other.xlsx"
+    other.write_bytes(b"other")
+    prefetcher = InputPrefetcher()
+    first, second = FakeLoader(), FakeLoader()
+    ready = []
+
+    prefetcher.start('monthly', input_file, first, ready.append)
+    first.started.wait(5)
+    prefetcher.start('monthly', str(other), second, ready.append)
+    first.release()
+    second.release()
+
+    assert first.cancelled_seen.wait(5)
+    assert prefetcher.get('monthly', input_file) is None
+    assert list(prefetcher.get('monthly', str(other))['path']) == [str(other)]
+    assert ready == ['monthly']
+
+def test_get_raises_when_cancelled_while_waiting(input_file):
+    prefetcher = InputPrefetcher()
+    loader = FakeLoader()
+    prefetcher.start('monthly', input_file, loader)
+
+    with pytest.raises(ReadCancelled):
+        prefetcher.get('monthly', input_file, cancelled=lambda: True)
+
+    # 미리 읽기는 계속되므로 다시 시작하면 결과를 사용할 수 있음
+    loader.release()
+    assert prefetcher.get('monthly', input_file) is not None
+
+def test_loader_error_is_reported(input_file):
+    errors = []
+    prefetcher = InputPrefetcher(on_error=errors.append)
+    loader = FakeLoader(error=ValueError("broken"))
+    loader.release()
+    prefetcher.start('vendor', input_file, loader)
+
+    assert prefetcher.get('vendor', input_file) is None
+    assert errors == ["파일 미리 읽기 오류: broken"]
@@ -0,0 +1,196 @@
+import zipfile
+from datetime import datetime
+from io import BytesIO
+from xml.etree import ElementTree
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.drawing.image import Image
+from openpyxl.formatting.rule import CellIsRule
+from openpyxl.styles import PatternFill
+from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.xml.constants import SHEET_MAIN_NS
+
+from resources.template_layout import TemplateLayout
+from services.statement_template import CompiledTemplate, StatementLayout, plan_pages
+
+def define(target, name, reference):
+    target.defined_names[name] = DefinedName(name, attr_text=reference)
+
+def make_template(path, names=None):
+    """기본 배치(또는 이름 정의로 바꾼 배치)의 간단한 템플릿을 만듭니다."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "거래명세표"
+    layout = StatementLayout()
+    if names:
+        for name, reference in names.items():
+            define(workbook, name, f"'거래명세표'!{reference}")
+        layout = StatementLayout.from_workbook(workbook, sheet)
+
+    first = layout.item_start_row
+    last = first + layout.items_per_page - 1
+    amount = layout.item_columns["공급가액"]
+    sheet[f"{amount}{last + 2}"] = f"=SUM({amount}{first}:{amount}{last})"
+    sheet[f"{amount}{last + 3}"] = f"=ROUND({amount}{last + 2}*0.1,0)"
+    workbook.save(path)
+    return layout
+
+def items(count, amount=1500):
+    return [(5, 1, "폐지", 3, "kg", 500, amount) for _ in range(count)]
+
+@pytest.mark.parametrize("count, sizes", [
+    (0, [0]),
+    (25, [25]),
+    (26, [25, 1]),
+    (49, [25, 24]),
+    (60, [25, 24, 11]),
+])
+def test_plan_pages_reserves_carry_forward_row(count, sizes):
+    pages = plan_pages("거래명세표", count)
+    assert [page.stop - page.start for page in pages] == sizes
+    assert [page.carry_forward for page in pages] == [False] + [True] * (len(sizes) - 1)
+    assert [page.last for page in pages] == [False] * (len(sizes) - 1) + [True]
+    assert pages[-1].stop == count
+
+def test_last_page_total_covers_all_items(tmp_path):
+    template = tmp_path / "template.xlsx"
+    make_template(template)
+    output = tmp_path / "out.xlsx"
+
+    pages = CompiledTemplate(str(template)).render(
+        str(output), "거래처", 2025, 5, items(60), prior_month_amount=100, ytd_amount=200
+    )
+
+    sheets = load_workbook(output, data_only=True).worksheets
+    assert pages == len(sheets) == 3
+    # 합계 영역과 전월/누계 금액은 마지막 페이지에만
+    assert [sheet["G35"].value for sheet in sheets] == [None, None, 90000]
+    assert [sheet["G39"].value for sheet in sheets] == [None, None, 100]
+    assert sheets[2]["G36"].value == 9000
+    assert sheets[1]["C9"].value == TemplateLayout.CARRY_FORWARD_LABEL
+    assert [sheet["G9"].value for sheet in sheets] == [1500, 37500, 73500]
+
+def test_defined_names_override_layout(tmp_path):
+    template = tmp_path / "template.xlsx"
+    layout = make_template(template, {
+        "ABR_VENDOR_NAME": "$C$2",
+        "ABR_YTD_AMOUNT": "$J$30",
+        "ABR_ITEMS": "$A$12:$I$21",
+        "ABR_AMOUNT": "$I$11",
+    })
+    assert layout.vendor_name_cell == "C2"
+    assert (layout.item_start_row, layout.items_per_page) == (12, 10)
+    assert layout.item_columns["공급가액"] == "I"
+    assert layout.item_columns["월"] == TemplateLayout.ITEM_COLUMNS["월"]
+
+    output = tmp_path / "out.xlsx"
+    CompiledTemplate(str(template)).render(
+        str(output), "거래처", 2025, 5, items(3, amount=700), ytd_amount=5000
+    )
+    sheet = load_workbook(output, data_only=True).active
+    assert sheet["C2"].value == "거래처"
+    assert [sheet[f"I{row}"].value for row in (12, 13, 14)] == [700, 700, 700]
+    assert sheet["I23"].value == 2100
+    assert sheet["J30"].value == 5000
+
+def test_sheet_settings_survive_on_every_page(tmp_path):
+    from PIL import Image as PILImage
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "거래명세표"
+    sheet["G35"] = "=SUM(G9:G33)"
+    sheet.sheet_view.showGridLines = False
+    sheet.sheet_view.zoomScale = 85
+    sheet.freeze_panes = "A9"
+    sheet.print_area = "A1:H40"
+    sheet.print_title_rows = "1:8"
+    sheet.oddFooter.center.text = "&P/&N"
+    sheet.conditional_formatting.add(
+        "G9:G33", CellIsRule(operator="lessThan", formula=["0"], fill=PatternFill("solid", "FF0000"))
+    )
+    validation = DataValidation(type="list", formula1='"kg,톤"')
+    validation.add("E9:E33")
+    sheet.add_data_validation(validation)
+    logo = BytesIO()
+    PILImage.new("RGB", (10, 10), "red").save(logo, format="PNG")
+    sheet.add_image(Image(logo), "A1")
+    template = tmp_path / "template.xlsx"
+    workbook.save(template)
+
+    # 캐시된 템플릿처럼 같은 템플릿으로 두 번 저장
+    compiled = CompiledTemplate(str(template))
+    compiled.render(str(tmp_path / "first.xlsx"), "거래처", 2025, 5, items(1))
+    output = tmp_path / "out.xlsx"
+    compiled.render(str(output), "거래처", 2025, 5, items(30))
+
+    sheets = load_workbook(output).worksheets
+    assert len(sheets) == 2
+    assert [sheet.sheet_view.tabSelected for sheet in sheets] == [True, False]
+    for sheet in sheets:
+        assert sheet.sheet_view.showGridLines is False
+        assert sheet.sheet_view.zoomScale == 85
+        assert sheet.freeze_panes == "A9"
+        assert sheet.print_area == f"'{sheet.title}'!$A$1:$H$40"
+        assert sheet.print_title_rows == "$1:$8"
+        assert sheet.oddFooter.center.text == "&P/&N"
+        assert [str(rule.sqref) for rule in sheet.conditional_formatting] == ["G9:G33"]
+        assert [str(dv.sqref) for dv in sheet.data_validations.dataValidation] == ["E9:E33"]
+        assert len(sheet._images) == 1
+
+def test_written_values_do_not_change_template_styles(tmp_path):
+    template_path = tmp_path / "template.xlsx"
+    make_template(template_path)
+    template = CompiledTemplate(str(template_path))
+    styles = [list(style) for *_, style in template.cells]
+
+    dated = [(5, 1, datetime(2025, 5, 1), 3, "kg", 500, 1500)]
+    template.render(str(tmp_path / "dated.xlsx"), "거래처", 2025, 5, dated)
+    template.render(str(tmp_path / "plain.xlsx"), "거래처", 2025, 5, items(1))
+
+    assert [list(style) for *_, style in template.cells] == styles
+    assert load_workbook(tmp_path / "plain.xlsx").active["C9"].number_format == "General"
+
+def test_single_row_item_range_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        make_template(tmp_path / "template.xlsx", {"ABR_ITEMS": "$A$12:$I$12"})
+
+def test_defined_name_on_other_sheet_is_rejected(tmp_path):
+    workbook = Workbook()
+    workbook.active.title = "거래명세표"
+    workbook.create_sheet("기타")
+    define(workbook, "ABR_ITEMS", "'기타'!$A$1:$G$5")
+    path = tmp_path / "template.xlsx"
+    workbook.save(path)
+
+    with pytest.raises(ValueError):
+        CompiledTemplate(str(path))
+
+def calc_properties(path):
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    return root.find(f"{{{SHEET_MAIN_NS}}}calcPr").attrib
+
+def test_calc_properties_follow_evaluation(tmp_path):
+    template_path = tmp_path / "template.xlsx"
+    make_template(template_path)
+    template = CompiledTemplate(str(template_path))
+
+    calculated = tmp_path / "calculated.xlsx"
+    template.render(str(calculated), "거래처", 2025, 5, items(3))
+    calc = calc_properties(calculated)
+    assert calc["calcId"] == str(TemplateLayout.CALC_ID)
+    assert calc.get("fullCalcOnLoad") in (None, "0")
+
+    # 계산하지 못하는 수식이 있으면 Excel 이 열 때 다시 계산
+    workbook = load_workbook(template_path)
+    workbook.active["H1"] = "=VLOOKUP(B4,A1:B2,2)"
+    workbook.save(template_path)
+    template = CompiledTemplate(str(template_path))
+    uncalculated = tmp_path / "uncalculated.xlsx"
+    template.render(str(uncalculated), "거래처", 2025, 5, items(3))
+    calc = calc_properties(uncalculated)
+    assert calc["calcId"] == str(template.calc_id)
+    assert calc["fullCalcOnLoad"] == "1"
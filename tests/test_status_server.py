@@ -0,0 +1,115 @@
+import json
+import types
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+import services.status_server as status_server
+from resources.status_server import StatusServerConfig
+from services.status_server import RunStatus, StatusServer
+
+class Clock:
+    """time.time() 대신 사용하는, 직접 앞으로 돌리는 시계입니다."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(status_server, "time", types.SimpleNamespace(time=clock))
+    return clock
+
+def test_stage_seconds_add_up(clock):
+    status = RunStatus()
+    status.start_run()
+    status.start_stage("read")
+    clock.advance(2)
+    status.start_stage("write")
+    clock.advance(3)
+    status.start_stage("read")
+    clock.advance(1)
+    assert status.snapshot()["stage_seconds"] == {"read": 3, "write": 3}
+
+    status.finish(cancelled=False)
+    clock.advance(10)
+    snapshot = status.snapshot()
+    assert snapshot["stage_seconds"] == {"read": 3, "write": 3}
+    assert snapshot["elapsed_seconds"] == 6
+    assert snapshot["state"] == "failed"
+
+def test_rewritten_vendor_is_counted_once(clock):
+    status = RunStatus()
+    status.start_run()
+    status.vendor_done("V001", 10)
+    status.vendor_done("V002", 5)
+    # 스트리밍 처리 후 전체 읽기로 다시 작성한 거래처
+    status.vendor_done("V001", 12)
+    clock.advance(2)
+
+    snapshot = status.snapshot()
+    assert snapshot["vendors_done"] == 2
+    assert snapshot["rows_processed"] == 17
+    assert snapshot["rows_per_second"] == 8.5
+
+def test_stalled_only_while_running(clock):
+    status = RunStatus()
+    status.start_run()
+    clock.advance(StatusServerConfig.STALL_SECONDS)
+    assert not status.snapshot()["stalled"]
+
+    clock.advance(1)
+    assert status.snapshot()["stalled"]
+
+    status.update_progress(50, "작성 중")
+    assert not status.snapshot()["stalled"]
+
+    clock.advance(StatusServerConfig.STALL_SECONDS + 1)
+    status.complete()
+    assert not status.snapshot()["stalled"]
+
+def test_prometheus_labels_are_escaped():
+    status = RunStatus()
+    status.start_run()
+    status.start_stage('읽기 "월별"\\파일\n')
+    assert 'stage="읽기 \\"월별\\"\\\\파일\\n"' in status.to_prometheus()
+
+@pytest.fixture
+def server():
+    status = RunStatus()
+    server = StatusServer(status, 0)
+    assert server.start()
+    yield server
+    server.stop()
+
+def get(server, path):
+    with urlopen(f"http://{server.host}:{server.port}{path}", timeout=5) as response:
+        return response.headers["Content-Type"], response.read().decode("utf-8")
+
+def test_server_serves_status_and_metrics(server):
+    server.status.start_run()
+    server.status.set_vendor_total(3)
+    server.status.vendor_done("V001", 4)
+
+    content_type, body = get(server, "/status")
+    assert content_type.startswith("application/json")
+    snapshot = json.loads(body)
+    assert (snapshot["state"], snapshot["vendors_done"], snapshot["vendors_total"]) == ("running", 1, 3)
+
+    content_type, body = get(server, "/metrics?format=text")
+    assert content_type.startswith("text/plain")
+    lines = body.splitlines()
+    assert "abr_vendors_total 3" in lines
+    assert "abr_rows_processed 4" in lines
+    assert 'abr_run_info{state="running",stage=""} 1' in lines
+
+    with pytest.raises(HTTPError) as error:
+        get(server, "/unknown")
+    assert error.value.code == 404
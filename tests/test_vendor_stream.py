@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from resources.schema import MonthlySchema
+from services.vendor_stream import UnsortedExport, iter_vendor_groups, vendor_key
+
+def make_monthly(path, codes):
+    """거래처코드 목록 순서대로 한 행씩 월별 거래명세서를 만듭니다."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(MonthlySchema.COLUMNS)
+    amount = MonthlySchema.COLUMNS.index(MonthlySchema.AMOUNT)
+    for index, code in enumerate(codes, 1):
+        row = [None] * len(MonthlySchema.COLUMNS)
+        row[0] = code
+        row[amount] = index * 100
+        sheet.append(row)
+    workbook.save(path)
+
+@pytest.mark.parametrize("code, expected", [
+    (123, "123"),
+    (123.0, "123"),
+    (12.5, "12.5"),
+    ("00123", "00123"),
+    (" V001 ", "V001"),
+    ("1e3", "1e3"),
+    (None, ""),
+    (float("nan"), ""),
+])
+def test_vendor_key(code, expected):
+    assert vendor_key(code) == expected
+
+def test_stream_groups_match_in_memory_groups(tmp_path):
+    path = tmp_path / "monthly.xlsx"
+    # 숫자 123 과 문자열 "00123" 은 서로 다른 거래처
+    codes = [123, 123, "00123", "V001", "V001", "V002"]
+    make_monthly(path, codes)
+    targets = {"123", "00123", "V001"}
+
+    streamed = {
+        key: list(data[MonthlySchema.AMOUNT])
+        for key, data in iter_vendor_groups(str(path), targets)
+    }
+
+    monthly = pd.read_excel(path, engine="openpyxl")
+    keys = monthly[MonthlySchema.VENDOR_CODE].map(vendor_key)
+    in_memory = {
+        key: list(data[MonthlySchema.AMOUNT])
+        for key, data in monthly[keys.isin(targets)].groupby(keys)
+    }
+
+    assert streamed == in_memory == {"123": [100, 200], "00123": [300], "V001": [400, 500]}
+
+def test_unsorted_export_is_detected(tmp_path):
+    path = tmp_path / "monthly.xlsx"
+    make_monthly(path, ["V001", "V002", "V001"])
+    with pytest.raises(UnsortedExport):
+        list(iter_vendor_groups(str(path), {"V001", "V002"}))
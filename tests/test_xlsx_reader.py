@@ -0,0 +1,86 @@
+import zipfile
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from services.xlsx_reader import ReadCancelled, iter_xlsx_rows, read_xlsx_columns
+
+SHARED_STRINGS = ["거래처코드", "V001", "V002"]
+
+# 빈 중간 행, 누락된 행, r 속성 없는 행과 셀, 날짜·논리값·오류·인라인 문자열,
+# 헤더 없는 열의 값, 뒤쪽 빈 행을 모두 포함
+SHEET_DATA = """<sheetData>
+<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="inlineStr"><is><t>일자</t></is></c><c r="C1" t="inlineStr"><is><t>수량</t></is></c><c r="D1" t="inlineStr"><is><t>여부</t></is></c><c r="E1" t="inlineStr"><is><r><t>비</t></r><r><t>고</t></r></is></c></row>
+<row r="2"><c r="A2" t="s"><v>1</v></c><c r="B2" s="1"><v>45778</v></c><c r="C2"><v>3</v></c><c r="D2" t="b"><v>1</v></c><c r="E2" t="e"><v>#N/A</v></c></row>
+<row r="4"/>
+<row r="5"><c t="s"><v>2</v></c><c s="1"><v>45779.5</v></c><c><v>2.5</v></c></row>
+<row><c r="A6" t="inlineStr"><is><t>V003</t></is></c><c r="G6"><v>7</v></c></row>
+<row r="7"><c r="C7"><v>1E3</v></c><c r="D7" t="b"><v>0</v></c><c r="E7" t="str"><f>A1</f><v>계산된 문자열</v></c></row>
+<row r="8"><c r="A8" s="1"/></row>
+<row r="9"/>
+</sheetData>"""
+
+def make_workbook(path):
+    """openpyxl 로 스타일(날짜 서식)을 만든 뒤 시트 데이터와 공유 문자열을 직접 작성합니다."""
+    workbook = Workbook()
+    workbook.active["A1"] = datetime(2025, 5, 1)
+    workbook.save(path)
+
+    with zipfile.ZipFile(path) as source:
+        parts = {name: source.read(name) for name in source.namelist()}
+
+    sheet = parts["xl/worksheets/sheet1.xml"].decode()
+    start, end = sheet.index("<sheetData"), sheet.index("</sheetData>") + len("</sheetData>")
+    parts["xl/worksheets/sheet1.xml"] = (sheet[:start] + SHEET_DATA + sheet[end:]).encode()
+
+    items = "".join(f"<si><t>{text}</t></si>" for text in SHARED_STRINGS)
+    parts["xl/sharedStrings.xml"] = (
+        '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        f'count="{len(SHARED_STRINGS)}" uniqueCount="{len(SHARED_STRINGS)}">{items}</sst>'
+    ).encode()
+    parts["[Content_Types].xml"] = parts["[Content_Types].xml"].decode().replace(
+        "</Types>",
+        '<Override PartName="/xl/sharedStrings.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/></Types>'
+    ).encode()
+    parts["xl/_rels/workbook.xml.rels"] = parts["xl/_rels/workbook.xml.rels"].decode().replace(
+        "</Relationships>",
+        '<Relationship Id="rIdShared" Type="http://schemas.openxmlformats.org/'
+        'officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>'
+        "</Relationships>"
+    ).encode()
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as target:
+        for name, data in parts.items():
+            target.writestr(name, data)
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    path = tmp_path / "monthly.xlsx"
+    make_workbook(path)
+    return str(path)
+
+def test_read_matches_read_excel(workbook_path):
+    expected = pd.read_excel(workbook_path, engine="openpyxl")
+    pd.testing.assert_frame_equal(read_xlsx_columns(workbook_path), expected)
+
+def test_column_subset_matches_read_excel(workbook_path):
+    columns = ["거래처코드", "일자", "수량"]
+    expected = pd.read_excel(workbook_path, engine="openpyxl", usecols=columns)
+    pd.testing.assert_frame_equal(read_xlsx_columns(workbook_path, columns), expected)
+
+def test_iter_rows_skips_blank_rows(workbook_path):
+    rows = list(iter_xlsx_rows(workbook_path, ["거래처코드", "수량"]))
+    assert rows == [
+        ["거래처코드", "수량"],
+        ["V001", 3],
+        ["V002", 2.5],
+        ["V003", ""],  # 보관하지 않는 열(G)에만 다른 값이 있는 행
+        ["", 1000],
+    ]
+
+def test_cancelled_read_raises(workbook_path):
+    with pytest.raises(ReadCancelled):
+        read_xlsx_columns(workbook_path, cancelled=lambda: True)
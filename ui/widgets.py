@@ -36,6 +36,10 @@ class FileSelectionFrame(ttk.LabelFrame):
         self.filename_label = ttk.Label(self, text="")
         self.filename_label.pack(fill="x", expand=True, pady=(5, 0))
         
+        # 미리 읽은 파일 요약 표시 레이블
+        self.preview_label = ttk.Label(self, text="", style="File.TLabel")
+        self.preview_label.pack(fill="x", expand=True)
+        
         # 파일 경로가 변경될 때마다 파일명 업데이트
         self.file_var.trace_add("write", self.update_filename)
         
@@ -60,6 +64,10 @@ class FileSelectionFrame(ttk.LabelFrame):
                 self.filename_label.config(text=f"선택된 파일: {filename}")
         else:
             self.filename_label.config(text="")
+            
+    def update_preview(self, text: str):
+        """미리 읽은 파일의 요약을 표시합니다."""
+        self.preview_label.config(text=text)
 
 class DirectorySelectionFrame(ttk.Frame):
     def __init__(self, parent, label_text, variable, row):